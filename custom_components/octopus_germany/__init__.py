@@ -5,18 +5,21 @@ This module provides integration with the Octopus Germany API for Home Assistant
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import timedelta, datetime, date
 import inspect
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, SupportsResponse
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util.dt import utcnow, as_utc, parse_datetime
 
 from .const import DOMAIN, CONF_EMAIL, CONF_PASSWORD, UPDATE_INTERVAL, DEBUG_ENABLED
-from .octopus_germany import OctopusGermany
+from .octopus_germany import OctopusAPIError, OctopusGermany
 
 import voluptuous as vol
 from homeassistant.core import ServiceCall
@@ -67,11 +70,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     password = entry.data["password"]
 
     # Initialize API
-    api = OctopusGermany(email, password)
+    api = OctopusGermany(hass, email, password)
 
     # Log in only once and reuse the token through the global token manager
     if not await api.login():
         _LOGGER.error("Failed to authenticate with Octopus Germany API")
+        await api.close()
         return False
 
     # Ensure DOMAIN is initialized in hass.data
@@ -90,6 +94,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             accounts = await api.fetch_accounts()
             if not accounts:
                 _LOGGER.error("No accounts found for the provided credentials")
+                await api.close()
                 return False
 
             # Store all accounts, not just the first one with electricity ledger
@@ -111,19 +116,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create data update coordinator with improved error handling and retry logic
     async def async_update_data():
         """Fetch data from API with improved error handling for all accounts."""
-        current_time = datetime.now()
+        # Monotonic clock, so wall-clock changes (DST, NTP) can't skew throttling
+        current_time = time.monotonic()
 
         # Add throttling to prevent too frequent API calls
         # Store last successful API call time on the function object
         if not hasattr(async_update_data, "last_api_call"):
-            async_update_data.last_api_call = datetime.now() - timedelta(
-                minutes=UPDATE_INTERVAL
-            )
+            async_update_data.last_api_call = current_time - UPDATE_INTERVAL * 60
 
         # Calculate time since last API call
-        time_since_last_call = (
-            current_time - async_update_data.last_api_call
-        ).total_seconds()
+        time_since_last_call = current_time - async_update_data.last_api_call
         min_interval = (
             UPDATE_INTERVAL * 60 * 0.9
         )  # 90% of the update interval in seconds
@@ -151,8 +153,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 caller_info = "Error getting caller info"
 
         _LOGGER.debug(
-            "Coordinator update called at %s (Update interval: %s minutes, Time since last API call: %.1f seconds, Caller: %s)",
-            current_time.strftime("%H:%M:%S"),
+            "Coordinator update called (Update interval: %s minutes, Time since last API call: %.1f seconds, Caller: %s)",
             UPDATE_INTERVAL,
             time_since_last_call,
             caller_info,
@@ -165,60 +166,84 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             and coordinator.data
         ):
             _LOGGER.debug(
-                "Throttling API call - returning cached data from %s",
-                async_update_data.last_api_call.strftime("%H:%M:%S"),
+                "Throttling API call - returning cached data from %.1f seconds ago",
+                time_since_last_call,
             )
             return coordinator.data
 
         try:
             # Let the API class handle token validation
-            _LOGGER.debug(
-                "Fetching data from API at %s", current_time.strftime("%H:%M:%S")
-            )
+            _LOGGER.debug("Fetching data from API")
 
-            # Fetch data for all accounts
+            # Fetch data for all accounts concurrently
             all_accounts_data = {}
-            for account_num in account_numbers:
+            results = await api.fetch_all_accounts(account_numbers)
+
+            async def process_account(account_num, account_data):
+                """Process the raw API data of an account into a more usable format."""
+                if isinstance(account_data, BaseException):
+                    raise account_data
+                if not account_data:
+                    return None
+                return await process_api_data(account_data, account_num, api)
+
+            # Processing fetches meter readings, so run the accounts concurrently
+            processed_results = await asyncio.gather(
+                *(
+                    process_account(account_num, account_data)
+                    for account_num, account_data in zip(account_numbers, results)
+                ),
+                return_exceptions=True,
+            )
+            for account_num, processed_account_data in zip(
+                account_numbers, processed_results
+            ):
                 try:
-                    # Fetch all data in one call to minimize API requests
-                    account_data = await api.fetch_all_data(account_num)
-                    if account_data:
-                        # Process the raw API data into a more usable format
-                        processed_account_data = await process_api_data(
-                            account_data, account_num, api
-                        )
+                    if isinstance(processed_account_data, BaseException):
+                        raise processed_account_data
+                    if processed_account_data:
                         all_accounts_data.update(processed_account_data)
                     else:
                         _LOGGER.warning(
                             "Failed to fetch data for account %s", account_num
                         )
+                except OctopusAPIError as e:
+                    _LOGGER.warning(
+                        "Failed to fetch data for account %s: %s", account_num, e
+                    )
                 except Exception as e:
-                    _LOGGER.error(
-                        "Error fetching data for account %s: %s", account_num, e
+                    _LOGGER.exception(
+                        "Error processing data for account %s: %s", account_num, e
                     )
-                    continue
 
             # Update last API call timestamp only on successful calls
             if all_accounts_data:
-                async_update_data.last_api_call = datetime.now()
+                async_update_data.last_api_call = time.monotonic()
 
             if not all_accounts_data:
+                # Without earlier data there is nothing to fall back to; let the
+                # coordinator report the failure (and retry setup on first refresh)
+                if not coordinator.data:
+                    raise UpdateFailed("Failed to fetch data from API for any account")
                 _LOGGER.error(
                     "Failed to fetch data from API for any account, returning last known data"
                 )
-                return coordinator.data if hasattr(coordinator, "data") else {}
+                return coordinator.data
 
             _LOGGER.debug(
-                "Successfully fetched data from API at %s for %d accounts",
-                datetime.now().strftime("%H:%M:%S"),
+                "Successfully fetched data from API for %d accounts",
                 len(all_accounts_data),
             )
             return all_accounts_data
 
+        except UpdateFailed:
+            raise
         except Exception as e:
             _LOGGER.exception("Unexpected error during data update: %s", e)
-            # Return previous data if available, empty dict otherwise
-            return coordinator.data if hasattr(coordinator, "data") else {}
+            # Without earlier data, fail the refresh (and retry setup on first refresh)
+            if not coordinator.data:
+                raise UpdateFailed(f"Unexpected error during data update: {e}") from e
+            return coordinator.data
 
     async def process_api_data(data, account_number, api):
         """Process raw API response into structured data."""
@@ -954,76 +979,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         result_data[account_number]["gas_meter_smart_reading"] = gas_meter_smart_reading
 
-        # Fetch latest gas meter reading if gas meter exists
+        # Fetch the latest gas and electricity meter readings in a single request
+        gas_meter_id = gas_meter.get("id") if gas_meter else None
+        electricity_meter_id = meter.get("id") if meter else None
         gas_latest_reading = None
-        if gas_meter and gas_meter.get("id"):
-            try:
-                gas_meter_id = gas_meter.get("id")
-                _LOGGER.debug(
-                    "Attempting to fetch gas meter reading for account %s, meter %s",
-                    account_number,
-                    gas_meter_id,
-                )
-                gas_latest_reading = await api.fetch_gas_meter_reading(
-                    account_number, gas_meter_id
-                )
-
-                if gas_latest_reading:
-                    _LOGGER.debug(
-                        "Successfully fetched gas meter reading: %s %s at %s",
-                        gas_latest_reading.get("value"),
-                        gas_latest_reading.get("units"),
-                        gas_latest_reading.get("intervalEnd"),
-                    )
-                else:
-                    _LOGGER.debug(
-                        "No gas meter reading returned for meter %s", gas_meter_id
-                    )
-
-            except Exception as e:
-                _LOGGER.warning(
-                    "Failed to fetch gas meter reading for account %s, meter %s: %s",
-                    account_number,
-                    gas_meter_id,
-                    str(e),
-                )
-
-        result_data[account_number]["gas_latest_reading"] = gas_latest_reading
-
-        # Fetch latest electricity meter reading if electricity meter exists
         electricity_latest_reading = None
-        if meter and meter.get("id"):
-            try:
-                electricity_meter_id = meter.get("id")
+        if gas_meter_id or electricity_meter_id:
+            _LOGGER.debug(
+                "Attempting to fetch meter readings for account %s, electricity meter %s, gas meter %s",
+                account_number,
+                electricity_meter_id,
+                gas_meter_id,
+            )
+            (
+                electricity_latest_reading,
+                gas_latest_reading,
+            ) = await api.fetch_latest_meter_readings(
+                account_number, electricity_meter_id, gas_meter_id
+            )
+
+            if gas_latest_reading:
                 _LOGGER.debug(
-                    "Attempting to fetch electricity meter reading for account %s, meter %s",
-                    account_number,
-                    electricity_meter_id,
-                )
-                electricity_latest_reading = await api.fetch_electricity_meter_reading(
-                    account_number, electricity_meter_id
+                    "Successfully fetched gas meter reading: %s at %s",
+                    gas_latest_reading.get("value"),
+                    gas_latest_reading.get("readAt"),
                 )
-
-                if electricity_latest_reading:
-                    _LOGGER.debug(
-                        "Successfully fetched electricity meter reading: %s at %s",
-                        electricity_latest_reading.get("value"),
-                        electricity_latest_reading.get("readAt"),
-                    )
-                else:
-                    _LOGGER.debug(
-                        "No electricity meter reading returned for meter %s",
-                        electricity_meter_id,
-                    )
-
-            except Exception as e:
-                _LOGGER.warning(
-                    "Failed to fetch electricity meter reading for account %s, meter %s: %s",
-                    account_number,
-                    electricity_meter_id,
-                    str(e),
+            if electricity_latest_reading:
+                _LOGGER.debug(
+                    "Successfully fetched electricity meter reading: %s at %s",
+                    electricity_latest_reading.get("value"),
+                    electricity_latest_reading.get("readAt"),
                 )
 
+        result_data[account_number]["gas_latest_reading"] = gas_latest_reading
         result_data[account_number]["electricity_latest_reading"] = (
             electricity_latest_reading
         )
@@ -1189,7 +1177,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     # Initial data refresh - only once to prevent duplicate API calls
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        await api.close()
+        raise
 
     # Log the account data after update to help diagnose attribute issues
     if coordinator.data and primary_account_number in coordinator.data:
@@ -1839,7 +1831,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Close the API client's persistent HTTP session
+        await entry_data["api"].close()
 
     return unload_ok
 
@@ -153,16 +153,20 @@ class OctopusIntelligentDispatchingBinarySensor(CoordinatorEntity, BinarySensorE
     @property
     def is_on(self) -> bool:
         """Return True if a planned dispatch for this device is currently active."""
-        active_dispatch = self._get_active_dispatch(debug=True)
+        # Only build the (expensive) diagnostic messages when they will be logged
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        active_dispatch = self._get_active_dispatch(debug=debug)
         if active_dispatch:
-            _LOGGER.debug(
-                f"[DISPATCH SENSOR] Sensor ON for device_id={self._device_id} at {as_local(utcnow()).strftime('%Y-%m-%d %H:%M:%S %Z')} (dispatch: {active_dispatch})"
-            )
+            if debug:
+                _LOGGER.debug(
+                    f"[DISPATCH SENSOR] Sensor ON for device_id={self._device_id} at {as_local(utcnow()).strftime('%Y-%m-%d %H:%M:%S %Z')} (dispatch: {active_dispatch})"
+                )
             return True
         else:
-            _LOGGER.debug(
-                f"[DISPATCH SENSOR] Sensor OFF for device_id={self._device_id} at {as_local(utcnow()).strftime('%Y-%m-%d %H:%M:%S %Z')}"
-            )
+            if debug:
+                _LOGGER.debug(
+                    f"[DISPATCH SENSOR] Sensor OFF for device_id={self._device_id} at {as_local(utcnow()).strftime('%Y-%m-%d %H:%M:%S %Z')}"
+                )
             return False
 
     @property
@@ -16,7 +16,7 @@ async def validate_credentials(
     hass: HomeAssistant, email: str, password: str
 ) -> tuple[bool, str | None, dict | None]:
     """Validate the user credentials by attempting API login."""
-    octopus_api = OctopusGermany(email, password)
+    octopus_api = OctopusGermany(hass, email, password)
     try:
         login_success = await octopus_api.login()
 
@@ -35,6 +35,8 @@ async def validate_credentials(
     except Exception:
         _LOGGER.exception("Unexpected error while validating credentials")
         return False, "unknown", None
+    finally:
+        await octopus_api.close()
 
 
 class OctopusGermanyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -8,6 +8,15 @@ CONF_PASSWORD = "password"
 # Debug interval settings
 UPDATE_INTERVAL = 1  # Update interval in minutes (set to 1 for faster testing)
 
+# Account data is served from memory if requested again within this many seconds
+RESPONSE_CACHE_TTL = 30
+
+# Property, tariff and meter data is re-fetched at most this often (seconds)
+STATIC_DATA_CACHE_TTL = 60 * 60
+
+# Accounts without smart devices skip the device lookup, re-checking this often (seconds)
+DEVICES_REPROBE_INTERVAL = 6 * 60 * 60
+
 # Schema exploration (run once for debugging)
 EXPLORE_SCHEMA_ONCE = True  # Set to True to run schema exploration once
 
@@ -16,6 +25,10 @@ TOKEN_REFRESH_MARGIN = (
     300  # Refresh token if less than 300 seconds (5 minutes) remaining
 )
 TOKEN_AUTO_REFRESH_INTERVAL = 50 * 60  # Auto refresh token every 50 minutes
+TOKEN_PROACTIVE_REFRESH_LEAD = (
+    60  # Refresh in the background this many seconds before the refresh margin
+)
+TOKEN_REFRESH_JITTER = 30  # Up to 30 seconds of random jitter between instances
 
 # Debug options
 DEBUG_ENABLED = True
@@ -4,34 +4,111 @@ Includes methods for authentication, fetching account details, managing devices,
 various data related to electricity usage and tariffs.
 """
 
+import base64
+import functools
+import hashlib
 import logging
 import json
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+import time
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union, cast
 import asyncio
-import jwt
+import random
+import weakref
+import aiohttp
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-from python_graphql_client import GraphqlClient
-from .const import TOKEN_AUTO_REFRESH_INTERVAL, TOKEN_REFRESH_MARGIN
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.util.json import json_loads
+from .const import (
+    DEVICES_REPROBE_INTERVAL,
+    LOG_API_RESPONSES,
+    RESPONSE_CACHE_TTL,
+    STATIC_DATA_CACHE_TTL,
+    TOKEN_AUTO_REFRESH_INTERVAL,
+    TOKEN_PROACTIVE_REFRESH_LEAD,
+    TOKEN_REFRESH_JITTER,
+    TOKEN_REFRESH_MARGIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 GRAPH_QL_ENDPOINT = "https://api.oeg-kraken.energy/v1/graphql/"
 ELECTRICITY_LEDGER = "ELECTRICITY_LEDGER"
 
-# Global dictionary to store token managers for each account (email)
-# This prevents redundant logins while supporting multiple accounts
-_TOKEN_MANAGERS = {}
+# Connection pool settings for the persistent HTTP session
+HTTP_MAX_CONNECTIONS = 4  # Requests sent to the API at the same time
+HTTP_REQUEST_TIMEOUT = 30  # Seconds before a request is aborted and retried
+
+# Retry settings for logins and transient request failures
+# (decorrelated-jitter backoff, in seconds)
+LOGIN_RETRIES = 5
+LOGIN_TIMEOUT = 120  # Seconds before a login, including all its retries, gives up
+REQUEST_RETRIES = 3
+BACKOFF_BASE = 1
+BACKOFF_MAX = 30
+
+# Login error codes that won't succeed on retry (e.g. invalid credentials)
+UNRECOVERABLE_LOGIN_ERROR_CODES = ("KT-CT-1113", "KT-CT-1134", "KT-CT-1135")
+
+# Error codes returned when a device is unknown or has no such resource
+MISSING_DEVICE_ERROR_CODES = frozenset(
+    {
+        "KT-CT-4301",  # Resource not found
+        "KT-CT-4313",  # Could not find KrakenFlex device
+    }
+)
+
+# Error codes that should not fail a data request. These are temporary API
+# issues or expected missing data scenarios; cached data is used instead.
+NON_CRITICAL_ERROR_CODES = frozenset(
+    {
+        "KT-CT-4301",  # Resource not found (expected when no data exists)
+        "KT-CT-4340",  # Unable to fetch flex planned dispatches (temporary)
+        "KT-CT-4382",  # Unable to fetch charging sessions (temporary)
+        "KT-CT-7899",  # Internal server error (temporary API issue)
+        "KT-CT-1111",  # Unauthorized for specific query (permission issue)
+    }
+)
+
+# Default for fetch_all_data() properties, meaning they have not been fetched yet
+_NOT_FETCHED = object()
+
+# Global dictionary to store token managers per credential (hash of email and password)
+# This prevents redundant logins while keeping separate accounts isolated.
+# Entries are dropped once no client uses the manager any more (e.g. after unload).
+_TOKEN_MANAGERS: "weakref.WeakValueDictionary[str, TokenManager]" = (
+    weakref.WeakValueDictionary()
+)
+
+# Fragments for the unit rate information shared by electricity and gas agreements
+UNIT_RATE_FRAGMENTS = """
+fragment SimpleUnitRateFields on SimpleProductUnitRateInformation {
+  __typename
+  grossRateInformation {
+    grossRate
+  }
+  latestGrossUnitRateCentsPerKwh
+}
 
-# Comprehensive query that gets all data in one go
-COMPREHENSIVE_QUERY = """
-query ComprehensiveDataQuery($accountNumber: String!) {
-  account(accountNumber: $accountNumber) {
-    id
-    ledgers {
-      balance
-      ledgerType
+fragment TimeOfUseUnitRateFields on TimeOfUseProductUnitRateInformation {
+  __typename
+  rates {
+    grossRateInformation {
+      grossRate
+    }
+    latestGrossUnitRateCentsPerKwh
+    timeslotActivationRules {
+      activeFromTime
+      activeToTime
     }
+    timeslotName
+  }
+}
+"""
+
+# Near-static property, tariff and meter data, cached between polls. The query
+# is built by _build_static_data_query() so several accounts can share a request.
+PROPERTIES_SELECTION = """
     allProperties {
       id
       electricityMalos {
@@ -46,35 +123,8 @@ query ComprehensiveDataQuery($accountNumber: String!) {
             grossRate
           }
           unitRateInformation {
-            ... on SimpleProductUnitRateInformation {
-              __typename
-              grossRateInformation {
-                date
-                grossRate
-                rateValidToDate
-                vatRate
-              }
-              latestGrossUnitRateCentsPerKwh
-              netUnitRateCentsPerKwh
-            }
-            ... on TimeOfUseProductUnitRateInformation {
-              __typename
-              rates {
-                grossRateInformation {
-                  date
-                  grossRate
-                  rateValidToDate
-                  vatRate
-                }
-                latestGrossUnitRateCentsPerKwh
-                netUnitRateCentsPerKwh
-                timeslotActivationRules {
-                  activeFromTime
-                  activeToTime
-                }
-                timeslotName
-              }
-            }
+            ...SimpleUnitRateFields
+            ...TimeOfUseUnitRateFields
           }
           unitRateForecast {
             validFrom
@@ -101,9 +151,7 @@ query ComprehensiveDataQuery($accountNumber: String!) {
           meterType
           number
           shouldReceiveSmartMeterData
-          submitMeterReadingUrl
         }
-        referenceConsumption
       }
       gasMalos {
         agreements {
@@ -117,35 +165,8 @@ query ComprehensiveDataQuery($accountNumber: String!) {
             grossRate
           }
           unitRateInformation {
-            ... on SimpleProductUnitRateInformation {
-              __typename
-              grossRateInformation {
-                date
-                grossRate
-                rateValidToDate
-                vatRate
-              }
-              latestGrossUnitRateCentsPerKwh
-              netUnitRateCentsPerKwh
-            }
-            ... on TimeOfUseProductUnitRateInformation {
-              __typename
-              rates {
-                grossRateInformation {
-                  date
-                  grossRate
-                  rateValidToDate
-                  vatRate
-                }
-                latestGrossUnitRateCentsPerKwh
-                netUnitRateCentsPerKwh
-                timeslotActivationRules {
-                  activeFromTime
-                  activeToTime
-                }
-                timeslotName
-              }
-            }
+            ...SimpleUnitRateFields
+            ...TimeOfUseUnitRateFields
           }
           validFrom
           validTo
@@ -157,51 +178,45 @@ query ComprehensiveDataQuery($accountNumber: String!) {
           meterType
           number
           shouldReceiveSmartMeterData
-          submitMeterReadingUrl
         }
-        referenceConsumption
       }
     }
+"""
+
+# Comprehensive query for the fast-changing account, device and dispatch data
+COMPREHENSIVE_QUERY = """
+query ComprehensiveDataQuery($accountNumber: String!, $includeDevices: Boolean!) {
+  account(accountNumber: $accountNumber) {
+    id
+    ledgers {
+      balance
+      ledgerType
+    }
   }
   completedDispatches(accountNumber: $accountNumber) {
-    delta
     deltaKwh
     end
-    endDt
     meta {
       location
       source
     }
     start
-    startDt
   }
-  devices(accountNumber: $accountNumber) {
+  devices(accountNumber: $accountNumber) @include(if: $includeDevices) {
     status {
       current
       currentState
       isSuspended
-            ... on SmartFlexVehicleStatus {
-                stateOfCharge {
-                    value
-                    timestamp
-                }
-                stateOfChargeLimit {
-                    upperSocLimit
-                    timestamp
-                    isLimitViolated
-                }
-            }
-            ... on SmartFlexChargePointStatus {
-                stateOfCharge {
-                    value
-                    timestamp
-                }
-                stateOfChargeLimit {
-                    upperSocLimit
-                    timestamp
-                    isLimitViolated
-                }
-            }
+      ... on SmartFlexVehicleStatus {
+        stateOfCharge {
+          value
+        }
+      }
+      ... on SmartFlexChargePointStatus {
+        stateOfCharge {
+          value
+        }
+      }
     }
     provider
     preferences {
@@ -216,113 +231,50 @@ query ComprehensiveDataQuery($accountNumber: String!) {
       unit
       gridExport
     }
-    preferenceSetting {
-      deviceType
-      id
-      mode
-      scheduleSettings {
-        id
-        max
-        min
-        step
-        timeFrom
-        timeStep
-        timeTo
-      }
-      unit
-    }
     name
-    integrationDeviceId
     id
     deviceType
-    alerts {
-      message
-      publishedAt
-    }
     ... on SmartFlexVehicle {
-      id
-      name
-      status {
-        current
-        currentState
-        isSuspended
-                ... on SmartFlexVehicleStatus {
-                    stateOfCharge {
-                        value
-                        timestamp
-                    }
-                    stateOfChargeLimit {
-                        upperSocLimit
-                        timestamp
-                        isLimitViolated
-                    }
-                }
-      }
       vehicleVariant {
         model
         batterySize
       }
       chargingSessions(first: 100) {
-        edges {
-          node {
-            start
-            end
-                        stateOfChargeChange
-                        stateOfChargeFinal
-            energyAdded {
-              value
-              unit
-            }
-            cost {
-              amount
-              currency
-            }
-            ... on SmartFlexChargingSession {
-              type
-            }
-          }
-        }
-        pageInfo {
-          hasNextPage
-          endCursor
-        }
+        ...ChargingSessionFields
       }
     }
     ... on SmartFlexChargePoint {
       chargingSessions(first: 100) {
-        edges {
-          node {
-            start
-            end
-                        stateOfChargeChange
-                        stateOfChargeFinal
-            energyAdded {
-              value
-              unit
-            }
-            cost {
-              amount
-              currency
-            }
-            ... on SmartFlexChargingSession {
-              type
-            }
-          }
-        }
-        pageInfo {
-          hasNextPage
-          endCursor
-        }
+        ...ChargingSessionFields
+      }
+    }
+  }
+}
+
+fragment ChargingSessionFields on DeviceChargingSessionConnection {
+  edges {
+    node {
+      start
+      end
+      stateOfChargeFinal
+      energyAdded {
+        value
+      }
+      cost {
+        amount
+      }
+      ... on SmartFlexChargingSession {
+        type
       }
     }
   }
 }
 """
 
-# Query to get latest gas meter readings
-GAS_METER_READINGS_QUERY = """
-query GasMeterReadings($accountNumber: String!, $meterId: ID!) {
-  gasMeterReadings(accountNumber: $accountNumber, meterId: $meterId, first: 1) {
+# Latest electricity and gas reading selections, combined into a single request
+# by _build_latest_readings_query()
+LATEST_ELECTRICITY_READING_SELECTION = """
+  electricityMeterReadings(accountNumber: $accountNumber, meterId: $electricityMeterId, first: 1) {
     edges {
       node {
         value
@@ -331,16 +283,14 @@ query GasMeterReadings($accountNumber: String!, $meterId: ID!) {
         typeOfRead
         origin
         meterId
+        registerType
       }
     }
   }
-}
 """
 
-# Query to get latest electricity meter readings
-ELECTRICITY_METER_READINGS_QUERY = """
-query ElectricityMeterReadings($accountNumber: String!, $meterId: ID!) {
-  electricityMeterReadings(accountNumber: $accountNumber, meterId: $meterId, first: 1) {
+LATEST_GAS_READING_SELECTION = """
+  gasMeterReadings(accountNumber: $accountNumber, meterId: $gasMeterId, first: 1) {
     edges {
       node {
         value
@@ -349,11 +299,9 @@ query ElectricityMeterReadings($accountNumber: String!, $meterId: ID!) {
         typeOfRead
         origin
         meterId
-        registerType
       }
     }
   }
-}
 """
 
 # Query to get latest smart meter readings
@@ -383,70 +331,6 @@ query IntrospectionQuery {
 """
 
 # Property schema query to see what's available on properties
-# Alternative queries to try different approaches for smart meter data
-ALTERNATIVE_METER_READINGS_QUERY_1 = """
-query getMeterReadings($accountNumber: String!, $propertyId: ID!) {
-  account(accountNumber: $accountNumber) {
-    property(id: $propertyId) {
-      electricityMeterPoints {
-        id
-        mpan
-        meterReadings(first: 24) {
-          edges {
-            node {
-              readAt
-              value
-              unit
-              readingSource
-            }
-          }
-        }
-        meters {
-          id
-          serialNumber
-          smartMeter
-        }
-      }
-    }
-  }
-}
-"""
-
-ALTERNATIVE_METER_READINGS_QUERY_2 = """
-query getPropertyMeasurements($accountNumber: String!, $propertyId: ID!) {
-  account(accountNumber: $accountNumber) {
-    property(id: $propertyId) {
-      id
-      address {
-        line1
-        postcode
-      }
-      electricityMeterPoints {
-        id
-        mpan
-        meters {
-          id
-          serialNumber
-          smartMeter
-          measurements(first: 24) {
-            edges {
-              node {
-                ... on IntervalMeasurementType {
-                  startAt
-                  endAt
-                  value
-                  unit
-                }
-              }
-            }
-          }
-        }
-      }
-    }
-  }
-}
-"""
-
 PROPERTY_SCHEMA_QUERY = """
 query PropertySchema($accountNumber: String!, $propertyId: ID!) {
   account(accountNumber: $accountNumber) {
@@ -538,29 +422,22 @@ query getSmartMeterUsageV2($accountNumber: String!, $propertyId: ID!, $date: Dat
 }
 """
 
-# Query based on electricityMalos structure
-ELECTRICITY_MALO_READINGS_QUERY = """
-query getElectricityMaloReadings($accountNumber: String!, $propertyId: ID!) {
+ELECTRICITY_SMART_METER_READINGS_QUERY = """
+query getSmartMeterUsage($accountNumber: String!, $propertyId: ID!, $date: Date!) {
   account(accountNumber: $accountNumber) {
     property(id: $propertyId) {
-      electricityMalos {
-        meter {
-          id
-          number
-          meterType
-          shouldReceiveSmartMeterData
-          registers {
-            obisCode
-            registerType
-            readings(first: 24) {
-              edges {
-                node {
-                  value
-                  readAt
-                  typeOfRead
-                  origin
-                }
-              }
+      measurements(
+        utilityFilters: {electricityFilters: {readingFrequencyType: HOUR_INTERVAL, readingQuality: COMBINED}}
+        startOn: $date
+        first: 24
+      ) {
+        edges {
+          node {
+            ... on IntervalMeasurementType {
+              endAt
+              startAt
+              unit
+              value
             }
           }
         }
@@ -570,10 +447,9 @@ query getElectricityMaloReadings($accountNumber: String!, $propertyId: ID!) {
 }
 """
 
-ELECTRICITY_SMART_METER_READINGS_QUERY = """
-query getSmartMeterUsage($accountNumber: String!, $propertyId: ID!, $date: Date!) {
-  account(accountNumber: $accountNumber) {
-    property(id: $propertyId) {
+# Hourly measurements starting on $date, selected once per date under an alias
+# by _build_smart_meter_readings_query()
+SMART_METER_MEASUREMENTS_SELECTION = """
       measurements(
         utilityFilters: {electricityFilters: {readingFrequencyType: HOUR_INTERVAL, readingQuality: COMBINED}}
         startOn: $date
@@ -590,9 +466,6 @@ query getSmartMeterUsage($accountNumber: String!, $propertyId: ID!, $date: Date!
           }
         }
       }
-    }
-  }
-}
 """
 
 ELECTRICITY_15MIN_READINGS_QUERY = """
@@ -733,25 +606,269 @@ query {
 }
 """
 
+# Mutation to obtain a Kraken token with email and password
+LOGIN_MUTATION = """
+mutation krakenTokenAuthentication($email: String!, $password: String!) {
+  obtainKrakenToken(input: { email: $email, password: $password }) {
+    token
+    payload
+  }
+}
+"""
+
+# Mutation to suspend or resume smart control of a device
+CHANGE_DEVICE_SUSPENSION_MUTATION = """
+mutation ChangeDeviceSuspension($deviceId: ID = "", $action: SmartControlAction!) {
+  updateDeviceSmartControl(input: {deviceId: $deviceId, action: $action}) {
+    id
+  }
+}
+"""
+
+FLEX_PLANNED_DISPATCHES_QUERY = """
+query FlexPlannedDispatches($deviceId: String!) {
+  flexPlannedDispatches(deviceId: $deviceId) {
+    end
+    energyAddedKwh
+    start
+    type
+  }
+}
+"""
+
+SET_DEVICE_PREFERENCES_MUTATION = """
+mutation SetDevicePreferences($input: SmartFlexDevicePreferencesInput!) {
+  setDevicePreferences(input: $input) {
+    id
+  }
+}
+"""
+
+WEEKDAYS = (
+    "MONDAY",
+    "TUESDAY",
+    "WEDNESDAY",
+    "THURSDAY",
+    "FRIDAY",
+    "SATURDAY",
+    "SUNDAY",
+)
+
+
+def _backoff_delay(previous: float) -> float:
+    """Get the delay before the next retry, given the previous delay.
+
+    Uses decorrelated jitter: each delay is drawn between BACKOFF_BASE and
+    three times the previous one, capped at BACKOFF_MAX. Unlike a fixed
+    exponential schedule, instances hitting the rate limit at the same
+    moment drift apart instead of retrying in lock-step.
+    """
+    return random.uniform(BACKOFF_BASE, min(BACKOFF_MAX, previous * 3))
+
+
+@functools.lru_cache(maxsize=64)
+def _compact_query(query: str) -> str:
+    """Collapse the whitespace of a GraphQL document before sending it.
+
+    The query constants are indented for readability, which adds a large
+    share of whitespace to every request body. None of them contain string
+    literals with spaces, so the whitespace is insignificant.
+    """
+    return " ".join(query.split())
+
+
+@functools.lru_cache(maxsize=8)
+def _build_static_data_query(count: int) -> str:
+    """Build a property data query for `count` accounts.
+
+    Each account is selected under the alias `a<i>`, with its account number
+    passed in the variable `$a<i>`.
+    """
+    arguments = ", ".join(f"$a{i}: String!" for i in range(count))
+    selections = "".join(
+        f"  a{i}: account(accountNumber: $a{i}) {{{PROPERTIES_SELECTION}  }}\n"
+        for i in range(count)
+    )
+    return (
+        f"query AccountPropertiesQuery({arguments}) {{\n{selections}}}\n"
+        + UNIT_RATE_FRAGMENTS
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _build_latest_readings_query(electricity: bool, gas: bool) -> str:
+    """Build a query for the latest reading of the given meter types."""
+    arguments = ["$accountNumber: String!"]
+    selections = []
+    if electricity:
+        arguments.append("$electricityMeterId: ID!")
+        selections.append(LATEST_ELECTRICITY_READING_SELECTION)
+    if gas:
+        arguments.append("$gasMeterId: ID!")
+        selections.append(LATEST_GAS_READING_SELECTION)
+    return (
+        f"query LatestMeterReadings({', '.join(arguments)}) {{"
+        + "".join(selections)
+        + "}\n"
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _build_smart_meter_readings_query(count: int) -> str:
+    """Build an hourly smart meter readings query for `count` dates.
+
+    The readings of each date are selected under the alias `d<i>`, with the
+    date passed in the variable `$d<i>`.
+    """
+    arguments = "".join(f", $d{i}: Date!" for i in range(count))
+    selections = "".join(
+        f"      d{i}: "
+        + SMART_METER_MEASUREMENTS_SELECTION.lstrip().replace("$date", f"$d{i}")
+        for i in range(count)
+    )
+    return (
+        "query getSmartMeterUsageByDate("
+        f"$accountNumber: String!, $propertyId: ID!{arguments}) {{\n"
+        "  account(accountNumber: $accountNumber) {\n"
+        "    property(id: $propertyId) {\n"
+        f"{selections}"
+        "    }\n"
+        "  }\n"
+        "}\n"
+    )
+
+
+def _hourly_readings(edges) -> List[Dict[str, Any]]:
+    """Convert smart meter measurement edges into reading dicts."""
+    return [
+        {
+            "start_time": node.get("startAt"),
+            "end_time": node.get("endAt"),
+            "value": node.get("value"),
+            "unit": node.get("unit"),
+        }
+        for edge in edges
+        if (node := edge.get("node"))
+    ]
+
+
+def _error_code(error) -> Optional[str]:
+    """Get the Kraken error code (e.g. KT-CT-1124) of a GraphQL error."""
+    return (error.get("extensions") or {}).get("errorCode")
+
+
+def _summarize_errors(errors) -> str:
+    """Format GraphQL errors as "code at path: message" for logging.
+
+    Keeps log lines short instead of dumping the full error dicts, which
+    can include large extension payloads.
+    """
+    if not errors:
+        return "no error details"
+    return "; ".join(
+        "%s at %s: %s"
+        % (
+            _error_code(error) or "no code",
+            ".".join(str(p) for p in error.get("path") or []) or "-",
+            error.get("message", "No message"),
+        )
+        for error in errors
+    )
+
+
+def _is_token_expired(response) -> bool:
+    """Return True if a GraphQL response was rejected because the JWT expired."""
+    if not isinstance(response, dict):
+        return False
+    return any(
+        _error_code(error) == "KT-CT-1124" for error in response.get("errors") or []
+    )
+
+
+def _decode_token_expiry(token: str) -> Optional[int]:
+    """Read the expiry time from a JWT payload without verifying its signature.
+
+    Only the `exp` claim is needed, so the base64url payload segment is decoded
+    directly.
+    """
+    payload = token.split(".", 2)[1]
+    payload += "=" * (-len(payload) % 4)
+    return json_loads(base64.urlsafe_b64decode(payload)).get("exp")
+
+
+class AccountData(TypedDict, total=False):
+    """Data for one account as returned by OctopusGermany.fetch_all_data().
+
+    The nested values are the raw GraphQL objects. charging_sessions is None
+    when the API reported an error for them, and plannedDispatches is missing
+    when they could not be fetched, so callers keep their cached values.
+    """
+
+    account: Dict[str, Any]
+    products: List[Dict[str, Any]]
+    completedDispatches: List[Dict[str, Any]]
+    devices: List[Dict[str, Any]]
+    plannedDispatches: List[Dict[str, Any]]
+    charging_sessions: Optional[List[Dict[str, Any]]]
+    electricity_smart_meter_readings: List[Dict[str, Any]]
+    electricity_smart_meter_readings_date: str
+    electricity_smart_meter_readings_label: str
+
+
+class OctopusAPIError(Exception):
+    """Raised when the Octopus Germany API cannot provide the requested data."""
+
 
 class TokenManager:
     """Centralized token management for Octopus Germany API."""
 
+    __slots__ = (
+        "_token",
+        "_expiry",
+        "_auth_headers",
+        "_refresh_future",
+        "_refresh_callback",
+        "_refresh_task",
+        "_refresh_jitter",
+        "_valid_until",
+        "_decoded_token",
+        "_decoded_expiry",
+        "__weakref__",
+    )
+
     def __init__(self):
         """Initialize the token manager."""
         self._token = None
         self._expiry = None
-        self._refresh_lock = asyncio.Lock()
+        # Shared request headers, updated in place whenever the token changes
+        self._auth_headers = {}
+        # Future of the login currently in flight, shared by concurrent callers
+        self._refresh_future = None
         self._refresh_callback = None
         self._refresh_task = None
+        # Random offset so multiple instances don't refresh at the same moment
+        self._refresh_jitter = 0
+        # Expiry minus TOKEN_REFRESH_MARGIN, precomputed for is_valid
+        self._valid_until = 0
+        # Last decoded token and its expiry, reused when the same token is set again
+        self._decoded_token = None
+        self._decoded_expiry = None
 
     @property
     def token(self):
         """Get the current token."""
         return self._token
 
+    @property
+    def auth_headers(self):
+        """Get the authorization headers for the current token."""
+        return self._auth_headers
+
     def set_refresh_callback(self, callback):
-        """Set a callback function to be called when token needs refreshing."""
+        """Set a callback function to be called when token needs refreshing.
+
+        The callback is called with force=True to refresh a still valid token.
+        """
         self._refresh_callback = callback
 
     async def start_auto_refresh(self):
@@ -763,19 +880,49 @@ class TokenManager:
         self._refresh_task = asyncio.create_task(self._auto_refresh_token())
         _LOGGER.debug("Started automatic token refresh task")
 
+    def stop_auto_refresh(self):
+        """Stop the automatic token refresh process."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        self._refresh_callback = None
+
+    def _seconds_until_refresh(self):
+        """Get the seconds to wait before refreshing the token ahead of expiry."""
+        if not self._expiry:
+            return TOKEN_AUTO_REFRESH_INTERVAL
+
+        now = time.time()
+        refresh_at = (
+            self._expiry
+            - TOKEN_REFRESH_MARGIN
+            - TOKEN_PROACTIVE_REFRESH_LEAD
+            - self._refresh_jitter
+        )
+        # Never wait less than the lead time, so a failed refresh can't spin
+        return max(refresh_at - now, TOKEN_PROACTIVE_REFRESH_LEAD)
+
     async def _auto_refresh_token(self):
-        """Automatically refresh the token every TOKEN_AUTO_REFRESH_INTERVAL seconds."""
+        """Automatically refresh the token shortly before it expires.
+
+        Refreshing ahead of expiry keeps the login round-trip off the path of
+        regular API calls. Without a known expiry, the token is refreshed
+        every TOKEN_AUTO_REFRESH_INTERVAL seconds.
+        """
         try:
             while True:
-                # Wait for the configured refresh interval
-                await asyncio.sleep(TOKEN_AUTO_REFRESH_INTERVAL)
+                expiry = self._expiry
+                await asyncio.sleep(self._seconds_until_refresh())
+
+                if self._expiry and self._expiry != expiry:
+                    # Token was replaced while waiting, reschedule for the new expiry
+                    continue
 
                 _LOGGER.info("Performing scheduled token refresh")
 
                 if self._refresh_callback is not None:
-                    # Force token refresh by temporarily invalidating the token expiry
-                    self._expiry = 0  # Set to expired
-                    await self._refresh_callback()
+                    # Keep the current token usable until the new one is set
+                    await self._refresh_callback(force=True)
                     _LOGGER.debug("Scheduled token refresh completed")
                 else:
                     _LOGGER.warning(
@@ -789,20 +936,14 @@ class TokenManager:
     @property
     def is_valid(self):
         """Check if the token is valid."""
-        # Fast path: If there is no token, it's definitely invalid
-        if not self._token or not self._expiry:
-            return False
-
-        now = datetime.utcnow().timestamp()
-
         # Token is valid if it has at least TOKEN_REFRESH_MARGIN seconds left before expiry
-        valid = now < (self._expiry - TOKEN_REFRESH_MARGIN)
+        now = time.time()
+        valid = now < self._valid_until
 
-        if not valid:
-            remaining_time = self._expiry - now if self._expiry else 0
+        if not valid and self._expiry and _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Token validity check: INVALID (expiry in %s seconds)",
-                int(remaining_time),
+                int(self._expiry - now),
             )
 
         return valid
@@ -810,69 +951,120 @@ class TokenManager:
     def set_token(self, token, expiry=None):
         """Set a new token and extract its expiry time."""
         self._token = token
+        self._auth_headers["Authorization"] = token
+        self._refresh_jitter = random.uniform(0, TOKEN_REFRESH_JITTER)
 
         if expiry:
             # Use expiry directly if provided
             self._expiry = expiry
-            now = datetime.utcnow().timestamp()
-            token_lifetime = self._expiry - now if self._expiry else 0
-            _LOGGER.debug(
-                "Token set with explicit expiry - valid for %s seconds",
-                int(token_lifetime),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Token set with explicit expiry - valid for %s seconds",
+                    int(self._expiry - time.time()),
+                )
         else:
             # Decode token to get expiry time
             try:
-                decoded = jwt.decode(token, options={"verify_signature": False})
-                self._expiry = decoded.get("exp")
-                now = datetime.utcnow().timestamp()
-                token_lifetime = self._expiry - now if self._expiry else 0
-                _LOGGER.debug(
-                    "Token set with decoded expiry - valid for %s seconds",
-                    int(token_lifetime),
-                )
+                if token != self._decoded_token:
+                    self._decoded_expiry = _decode_token_expiry(token)
+                    self._decoded_token = token
+                self._expiry = self._decoded_expiry
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    token_lifetime = self._expiry - time.time() if self._expiry else 0
+                    _LOGGER.debug(
+                        "Token set with decoded expiry - valid for %s seconds",
+                        int(token_lifetime),
+                    )
             except Exception as e:
                 # Fallback: If token decoding fails, set expiry to TOKEN_AUTO_REFRESH_INTERVAL from now
-                now = datetime.utcnow().timestamp()
-                self._expiry = now + TOKEN_AUTO_REFRESH_INTERVAL
+                self._expiry = time.time() + TOKEN_AUTO_REFRESH_INTERVAL
                 _LOGGER.warning(
                     "Failed to decode token expiry: %s. Setting fallback expiry to %s minutes",
                     e,
                     TOKEN_AUTO_REFRESH_INTERVAL // 60,
                 )
 
+        self._valid_until = (
+            self._expiry - TOKEN_REFRESH_MARGIN if token and self._expiry else 0
+        )
+
     def clear(self):
         """Clear token and expiry."""
         self._token = None
         self._expiry = None
+        self._valid_until = 0
+        self._decoded_token = None
+        self._decoded_expiry = None
+        self._auth_headers.pop("Authorization", None)
 
 
 class OctopusGermany:
-    def __init__(self, email: str, password: str):
+    __slots__ = (
+        "_hass",
+        "_email",
+        "_password",
+        "_token_manager",
+        "_session",
+        "_request_slots",
+        "_static_cache",
+        "_schema_explored",
+        "_inflight",
+        "_response_cache",
+        "_devices_missing",
+    )
+
+    def __init__(self, hass: HomeAssistant, email: str, password: str):
         """Initialize the OctopusGermany API client.
 
         Args:
+            hass: The Home Assistant instance, used for the HTTP session
             email: The email address for the Octopus Germany account
             password: The password for the Octopus Germany account
         """
+        self._hass = hass
         self._email = email
         self._password = password
 
-        # Use shared token manager for this email to prevent redundant login attempts
-        global _TOKEN_MANAGERS
-        if email not in _TOKEN_MANAGERS:
-            _TOKEN_MANAGERS[email] = TokenManager()
+        # Use shared token manager for these credentials to prevent redundant login attempts
+        key = hashlib.sha256(f"{email}:{password}".encode()).hexdigest()
+        token_manager = _TOKEN_MANAGERS.get(key)
+        if token_manager is None:
+            token_manager = _TOKEN_MANAGERS[key] = TokenManager()
             _LOGGER.debug("Created new TokenManager for %s", email)
         else:
             _LOGGER.debug("Reusing existing TokenManager for %s", email)
 
-        self._token_manager = _TOKEN_MANAGERS[email]
+        self._token_manager = token_manager
+
+        # Persistent HTTP session, created lazily on the first request
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Limits the requests sent over the session at the same time
+        self._request_slots = asyncio.Semaphore(HTTP_MAX_CONNECTIONS)
+
+        # Cached property data per account number as (fetched_at, allProperties)
+        self._static_cache = {}
 
-        # Set up the token manager refresh callback
-        self._token_manager.set_refresh_callback(self.login)
+        # Whether the property schema has been explored for debugging
+        self._schema_explored = False
 
-        # Start the auto-refresh task immediately
-        asyncio.create_task(self._token_manager.start_auto_refresh())
+        # Tasks of fetch_all_data() calls in flight, keyed by account number
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Recent fetch_all_data() results per account number as (fetched_at, result)
+        self._response_cache: Dict[str, Tuple[float, AccountData]] = {}
+
+        # When the device lookup last failed per account number (no smart devices)
+        self._devices_missing: Dict[str, float] = {}
+
+        # Start refreshing the token in the background, unless another client
+        # sharing this token manager already does
+        token_manager = self._token_manager
+        if token_manager._refresh_callback is None or (
+            token_manager._refresh_task is not None
+            and token_manager._refresh_task.done()
+        ):
+            token_manager.set_refresh_callback(self.login)
+            asyncio.create_task(token_manager.start_auto_refresh())
 
     @property
     def _token(self):
@@ -880,166 +1072,274 @@ class OctopusGermany:
         return self._token_manager.token
 
     def _get_auth_headers(self):
-        """Get headers with authorization token."""
-        return {"Authorization": self._token} if self._token else {}
-
-    def _get_graphql_client(self, additional_headers=None):
-        """Get a GraphQL client with authorization headers."""
-        headers = self._get_auth_headers()
-        if additional_headers:
-            headers.update(additional_headers)
-        return GraphqlClient(endpoint=GRAPH_QL_ENDPOINT, headers=headers)
-
-    async def login(self) -> bool:
-        """Login and obtain a new token."""
+        """Get headers with authorization token.
+
+        The returned dict is shared with the token manager and must not be mutated.
+        """
+        return self._token_manager.auth_headers
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the persistent HTTP session, creating it on first use.
+
+        Reusing one session keeps the TCP/TLS connection to the API alive
+        between requests instead of opening a new one for every query. The
+        session comes from Home Assistant, which sets its user agent, SSL
+        context and orjson serializer, and closes it on shutdown.
+        """
+        if self._session is None or self._session.closed:
+            self._session = async_create_clientsession(
+                self._hass,
+                timeout=aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT),
+            )
+        return self._session
+
+    async def _execute_graphql(
+        self,
+        query,
+        variables=None,
+        headers=None,
+        retry_on_auth=True,
+        request_retries=REQUEST_RETRIES,
+    ):
+        """Execute a GraphQL request using the persistent HTTP session.
+
+        Network errors, timeouts and 5xx responses are retried up to
+        REQUEST_RETRIES times with backoff. If an authenticated request fails
+        because the token has expired, the token is refreshed and the request
+        is retried once.
+
+        Args:
+            query: The GraphQL query or mutation
+            variables: Optional variables for the query
+            headers: Headers to send instead of the authorization headers
+            retry_on_auth: Whether to log in again and retry on an expired token
+            request_retries: Number of attempts on transient failures
+
+        Returns:
+            The decoded JSON response
+        """
+        authenticated = headers is None
+        if authenticated:
+            headers = self._get_auth_headers()
+        request_body = {"query": _compact_query(query), "variables": variables or {}}
+        sent_token = self._token_manager.token
+        result = await self._post_graphql(request_body, headers, request_retries)
+
+        if authenticated and retry_on_auth and _is_token_expired(result):
+            # Another request may already have replaced the expired token
+            if self._token_manager.token == sent_token:
+                _LOGGER.warning("Token expired, refreshing...")
+                self._token_manager.clear()
+            if self._token_manager.token is not None or await self.login():
+                # The shared auth headers now carry the new token
+                result = await self._post_graphql(
+                    request_body, headers, request_retries
+                )
+        return result
+
+    async def _post_graphql(self, request_body, headers, retries=REQUEST_RETRIES):
+        """Post a GraphQL request body, retrying transient failures with backoff."""
+        delay = BACKOFF_BASE
+        for attempt in range(1, retries + 1):
+            try:
+                async with self._request_slots, self._get_session().post(
+                    GRAPH_QL_ENDPOINT, json=request_body, headers=headers
+                ) as response:
+                    if response.status >= 500:
+                        response.raise_for_status()
+                    return await response.json(loads=json_loads)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                # Client errors (4xx, unexpected content) won't succeed on retry
+                recoverable = (
+                    not isinstance(err, aiohttp.ClientResponseError)
+                    or err.status >= 500
+                )
+                if not recoverable or attempt == retries:
+                    raise
+                delay = _backoff_delay(delay)
+                _LOGGER.debug(
+                    "Request failed (%s), retrying in %.1f seconds", err, delay
+                )
+                await asyncio.sleep(delay)
+
+    async def close(self):
+        """Close the persistent HTTP session and stop refreshing the token."""
+        for task in self._inflight.values():
+            task.cancel()
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+        # The refresh task keeps the token manager alive; stop it if it refreshes
+        # through this client, so the manager can be released
+        if self._token_manager._refresh_callback == self.login:
+            self._token_manager.stop_auto_refresh()
+
+    async def login(self, force: bool = False) -> bool:
+        """Login and obtain a new token.
+
+        Concurrent callers share a single in-flight login instead of each
+        waiting for and re-checking the token in turn. The login, including
+        all its retries, gives up after LOGIN_TIMEOUT seconds.
+
+        Args:
+            force: Log in even if the current token is still valid
+        """
+        token_manager = self._token_manager
+        if token_manager._refresh_future is not None:
+            _LOGGER.debug("Login already in progress, waiting for its result")
+            return await asyncio.shield(token_manager._refresh_future)
+
+        # Check if token is still valid before starting a new login
+        if not force and token_manager.is_valid:
+            _LOGGER.debug("Token still valid, skipping login")
+            return True
+
+        refresh_future = asyncio.get_running_loop().create_future()
+        token_manager._refresh_future = refresh_future
+        old_token = token_manager.token
+        old_expiry = token_manager._expiry
+        success = False
+        try:
+            async with asyncio.timeout(LOGIN_TIMEOUT):
+                success = await self._obtain_token()
+        except TimeoutError:
+            _LOGGER.error("Login did not complete within %s seconds", LOGIN_TIMEOUT)
+        finally:
+            # Restore the previous token if the login failed completely
+            if not success and old_token and token_manager.token is None:
+                token_manager.set_token(old_token, old_expiry)
+                _LOGGER.debug("Restored previous token after failed login attempts")
+            token_manager._refresh_future = None
+            refresh_future.set_result(success)
+        return success
+
+    async def _obtain_token(self) -> bool:
+        """Obtain a new token from the API, retrying on failures."""
         # Import constants for logging options
         from .const import LOG_TOKEN_RESPONSES
 
-        # Use a lock to prevent multiple concurrent login attempts
-        async with self._token_manager._refresh_lock:
-            # Check if token is still valid after waiting for the lock
-            if self._token_manager.is_valid:
-                _LOGGER.debug("Token still valid after lock, skipping login")
-                return True
-
-            # Clear the current token before attempting login to avoid sending expired token
-            old_token = self._token_manager._token
-            self._token_manager._token = None
-            _LOGGER.debug("Cleared expired token for fresh login attempt")
-
-            query = """
-                mutation krakenTokenAuthentication($email: String!, $password: String!) {
-                  obtainKrakenToken(input: { email: $email, password: $password }) {
-                    token
-                    payload
-                  }
-                }
-            """
-            variables = {"email": self._email, "password": self._password}
-            # Create client without any authorization headers for login
-            client = GraphqlClient(endpoint=GRAPH_QL_ENDPOINT, headers={})
-
-            retries = 5  # Reduced from 10 to 5 retries for simpler logic
-            attempt = 0
-            delay = 1  # Start with 1 second delay
-            max_delay = 30  # Cap the delay at 30 seconds
-
-            while attempt < retries:
-                attempt += 1
-                try:
-                    _LOGGER.debug("Making login attempt %s of %s", attempt, retries)
-                    response = await client.execute_async(
-                        query=query, variables=variables
+        variables = {"email": self._email, "password": self._password}
+
+        retries = LOGIN_RETRIES
+        delay = BACKOFF_BASE
+
+        for attempt in range(1, retries + 1):
+            # Delay before the next attempt, none after the last one
+            delay = _backoff_delay(delay) if attempt < retries else 0
+            try:
+                _LOGGER.debug("Making login attempt %s of %s", attempt, retries)
+                # Send without any authorization headers for login. Transient
+                # failures are retried by this loop, not per request as well
+                response = await self._execute_graphql(
+                    query=LOGIN_MUTATION,
+                    variables=variables,
+                    headers={},
+                    request_retries=1,
+                )
+
+                # Log token response when LOG_TOKEN_RESPONSES is enabled
+                if LOG_TOKEN_RESPONSES:
+                    # Mask the token for logging, copying only the dicts on its path
+                    safe_response = response
+                    data = response.get("data") or {}
+                    token_data = data.get("obtainKrakenToken") or {}
+                    token = token_data.get("token")
+                    if token and len(token) > 10:
+                        # Keep first 5 and last 5 chars, mask the rest
+                        masked_token = token[:5] + "*" * (len(token) - 10) + token[-5:]
+                        safe_response = {
+                            **response,
+                            "data": {
+                                **data,
+                                "obtainKrakenToken": {
+                                    **token_data,
+                                    "token": masked_token,
+                                },
+                            },
+                        }
+                    _LOGGER.info(
+                        "Token response (partial): %s",
+                        json.dumps(safe_response, indent=2),
                     )
 
-                    # Log token response when LOG_TOKEN_RESPONSES is enabled
-                    if LOG_TOKEN_RESPONSES:
-                        # Create a safe copy of the response for logging
-                        import copy
+                if "errors" in response:
+                    error_code = _error_code(response["errors"][0])
+                    error_message = response["errors"][0].get(
+                        "message", "Unknown error"
+                    )
 
-                        safe_response = copy.deepcopy(response)
-                        # Check if we have a token in the response and mask most of it for logging
-                        if (
-                            "data" in safe_response
-                            and "obtainKrakenToken" in safe_response["data"]
-                            and "token" in safe_response["data"]["obtainKrakenToken"]
-                        ):
-                            token = safe_response["data"]["obtainKrakenToken"]["token"]
-                            if token and len(token) > 10:
-                                # Keep first 5 and last 5 chars, mask the rest
-                                mask_length = len(token) - 10
-                                masked_token = (
-                                    token[:5] + "*" * mask_length + token[-5:]
-                                )
-                                safe_response["data"]["obtainKrakenToken"]["token"] = (
-                                    masked_token
-                                )
-                        _LOGGER.info(
-                            "Token response (partial): %s",
-                            json.dumps(safe_response, indent=2),
+                    if error_code == "KT-CT-1199":  # Too many requests
+                        _LOGGER.warning(
+                            "Rate limit hit. Retrying in %.1f seconds... (attempt %s of %s)",
+                            delay,
+                            attempt,
+                            retries,
                         )
-
-                    if "errors" in response:
-                        error_code = (
-                            response["errors"][0].get("extensions", {}).get("errorCode")
+                        await asyncio.sleep(delay)
+                        continue
+                    elif error_code in UNRECOVERABLE_LOGIN_ERROR_CODES:
+                        # Invalid credentials won't get better by retrying
+                        _LOGGER.error(
+                            "Login failed: %s (code: %s), not retrying",
+                            error_message,
+                            error_code,
                         )
-                        error_message = response["errors"][0].get(
-                            "message", "Unknown error"
+                        break
+                    else:
+                        _LOGGER.error(
+                            "Login failed: %s (attempt %s of %s)",
+                            error_message,
+                            attempt,
+                            retries,
                         )
+                        # For other types of errors, continue with retries
+                        await asyncio.sleep(delay)
+                        continue
 
-                        if error_code == "KT-CT-1199":  # Too many requests
-                            _LOGGER.warning(
-                                "Rate limit hit. Retrying in %s seconds... (attempt %s of %s)",
-                                delay,
-                                attempt,
-                                retries,
-                            )
-                            await asyncio.sleep(delay)
-                            delay = min(
-                                delay * 2, max_delay
-                            )  # Exponential backoff with max cap
-                            continue
-                        else:
-                            _LOGGER.error(
-                                "Login failed: %s (attempt %s of %s)",
-                                error_message,
-                                attempt,
-                                retries,
-                            )
-                            # For other types of errors, continue with retries
-                            await asyncio.sleep(delay)
-                            delay = min(delay * 2, max_delay)
-                            continue
-
-                    if "data" in response and "obtainKrakenToken" in response["data"]:
-                        token_data = response["data"]["obtainKrakenToken"]
-                        token = token_data.get("token")
-                        payload = token_data.get("payload")
-
-                        if token:
-                            # Pass both token and expiration time to the token manager
-                            if (
-                                payload
-                                and isinstance(payload, dict)
-                                and "exp" in payload
-                            ):
-                                expiration = payload["exp"]
-                                self._token_manager.set_token(token, expiration)
-                            else:
-                                # Fall back to JWT decoding if no payload available
-                                self._token_manager.set_token(token)
+                if "data" in response and "obtainKrakenToken" in response["data"]:
+                    token_data = response["data"]["obtainKrakenToken"]
+                    token = token_data.get("token")
+                    payload = token_data.get("payload")
 
-                            return True
+                    if token:
+                        # Pass both token and expiration time to the token manager
+                        if (
+                            payload
+                            and isinstance(payload, dict)
+                            and "exp" in payload
+                        ):
+                            expiration = payload["exp"]
+                            self._token_manager.set_token(token, expiration)
                         else:
-                            _LOGGER.error(
-                                "No token in response despite successful request (attempt %s of %s)",
-                                attempt,
-                                retries,
-                            )
+                            # Fall back to JWT decoding if no payload available
+                            self._token_manager.set_token(token)
+
+                        return True
                     else:
                         _LOGGER.error(
-                            "Unexpected API response format at attempt %s: %s",
+                            "No token in response despite successful request (attempt %s of %s)",
                             attempt,
-                            response,
+                            retries,
                         )
+                else:
+                    _LOGGER.error(
+                        "Unexpected API response format at attempt %s: %s",
+                        attempt,
+                        response,
+                    )
 
-                    # If we got here with an invalid response, try again
-                    await asyncio.sleep(delay)
-                    delay = min(delay * 2, max_delay)
-
-                except Exception as e:
-                    _LOGGER.error("Error during login attempt %s: %s", attempt, e)
-                    # If this is our last attempt, don't sleep
-                    if attempt < retries:
-                        await asyncio.sleep(delay)
-                        delay = min(delay * 2, max_delay)
+                # If we got here with an invalid response, try again
+                await asyncio.sleep(delay)
 
+            except Exception as e:
+                _LOGGER.error("Error during login attempt %s: %s", attempt, e)
+                await asyncio.sleep(delay)
+        else:
             _LOGGER.error("All %s login attempts failed.", retries)
-            # Restore the previous token if login failed completely
-            if old_token:
-                self._token_manager._token = old_token
-                _LOGGER.debug("Restored previous token after failed login attempts")
-            return False
+
+        return False
 
     async def ensure_token(self):
         """Ensure a valid token is available, refreshing if necessary."""
@@ -1053,10 +1353,8 @@ class OctopusGermany:
         """Fetch accounts and initial data in a single API call."""
         await self.ensure_token()
 
-        client = self._get_graphql_client()
-
         try:
-            response = await client.execute_async(query=ACCOUNT_DISCOVERY_QUERY)
+            response = await self._execute_graphql(query=ACCOUNT_DISCOVERY_QUERY)
             _LOGGER.debug("Fetch accounts with initial data response: %s", response)
 
             if "data" in response and "viewer" in response["data"]:
@@ -1089,32 +1387,98 @@ class OctopusGermany:
         return await self.fetch_accounts_with_initial_data()
 
     # Comprehensive data fetch in a single query
-    async def fetch_all_data(self, account_number: str):
+    async def fetch_all_data(
+        self, account_number: str, properties=_NOT_FETCHED
+    ) -> AccountData:
         """Fetch all data for an account including devices, dispatches and account details.
 
-        This comprehensive query consolidates multiple separate queries into one
-        to minimize API calls and improve performance.
-        """
-        if not await self.ensure_token():
-            _LOGGER.error("Failed to ensure valid token for fetch_all_data")
-            return None
+        Devices, dispatches and ledgers are fetched on every call, while the
+        property and tariff data comes from fetch_static_data() and is only
+        re-requested when its cache expires. Concurrent calls for the same
+        account share a single fetch, and results are reused for
+        RESPONSE_CACHE_TTL seconds or until a mutation invalidates them.
 
-        variables = {"accountNumber": account_number}
-        client = self._get_graphql_client()
+        Args:
+            account_number: The account number
+            properties: allProperties already fetched by the caller (None if
+                unavailable), so no separate property request is sent
+
+        Raises:
+            OctopusAPIError: If the request fails or returns no usable data
+        """
+        cached = self._response_cache.get(account_number)
+        if cached and time.time() - cached[0] < RESPONSE_CACHE_TTL:
+            _LOGGER.debug("Using cached data for account %s", account_number)
+            return cached[1]
+
+        task = self._inflight.get(account_number)
+        if task is not None:
+            _LOGGER.debug("Joining in-flight fetch for account %s", account_number)
+        else:
+            # Run the fetch as its own task, so a cancelled caller doesn't
+            # cancel it for the others waiting on the same account
+            task = asyncio.create_task(
+                self._fetch_all_data(account_number, properties)
+            )
+            self._inflight[account_number] = task
+            task.add_done_callback(
+                functools.partial(self._finish_fetch, account_number)
+            )
+        return await asyncio.shield(task)
+
+    def _finish_fetch(self, account_number: str, task: asyncio.Task) -> None:
+        """Cache the result of a finished fetch_all_data() task."""
+        if self._inflight.get(account_number) is task:
+            del self._inflight[account_number]
+        if task.cancelled():
+            return
+        # Retrieving the exception also marks it as handled if every caller left
+        if task.exception() is None and (result := task.result()):
+            self._response_cache[account_number] = (time.time(), result)
+
+    def invalidate_response_cache(self):
+        """Drop cached account data so the next fetch reflects a change."""
+        self._response_cache.clear()
+
+    async def _fetch_all_data(
+        self, account_number: str, properties=_NOT_FETCHED
+    ) -> AccountData:
+        """Fetch all data for an account, see fetch_all_data()."""
+        if not await self.ensure_token():
+            raise OctopusAPIError("Failed to ensure valid token for fetch_all_data")
 
+        # Accounts without smart devices only re-check for them occasionally
+        devices_missing_at = self._devices_missing.get(account_number)
+        include_devices = (
+            devices_missing_at is None
+            or time.time() - devices_missing_at >= DEVICES_REPROBE_INTERVAL
+        )
+        variables = {"accountNumber": account_number, "includeDevices": include_devices}
         try:
             _LOGGER.debug(
                 "Making API request to fetch_all_data for account %s",
                 account_number,
             )
-            response = await client.execute_async(
-                query=COMPREHENSIVE_QUERY, variables=variables
-            )
+            if properties is _NOT_FETCHED:
+                response, properties = await asyncio.gather(
+                    self._execute_graphql(
+                        query=COMPREHENSIVE_QUERY, variables=variables
+                    ),
+                    self.fetch_static_data(account_number),
+                )
+            else:
+                response = await self._execute_graphql(
+                    query=COMPREHENSIVE_QUERY, variables=variables
+                )
 
-            # Log the full API response only when LOG_API_RESPONSES is enabled
-            from .const import LOG_API_RESPONSES
+            # Merge in the near-static property data, which is cached between polls
+            account_data = (response or {}).get("data") or {}
+            if account_data.get("account") and properties is not None:
+                account_data["account"]["allProperties"] = properties
 
-            if LOG_API_RESPONSES:
+            # Log the full API response only when LOG_API_RESPONSES is enabled
+            # and the record will actually be emitted (formatting is expensive)
+            if LOG_API_RESPONSES and _LOGGER.isEnabledFor(logging.INFO):
                 _LOGGER.info("API Response: %s", json.dumps(response, indent=2))
             else:
                 _LOGGER.debug(
@@ -1122,84 +1486,93 @@ class OctopusGermany:
                 )
 
             if response is None:
-                _LOGGER.error("API returned None response")
-                return None
-
-            # Initialize the result structure - note that 'products' is an empty list
-            # since we removed that field from the query
-            result = {
-                "account": {},
-                "products": [],  # This will stay empty as we removed the property field
-                "completedDispatches": [],
-                "devices": [],
-                "plannedDispatches": [],
-            }
+                raise OctopusAPIError("API returned None response")
 
             # Now check for partial data availability - we'll continue even if there are some errors
-            if "data" in response:
+            if response.get("data"):
                 data = response["data"]
 
-                # Process available data fields
-                if "account" in data:
-                    result["account"] = data["account"]
+                # Missing or null fields fall back to empty values
+                result: AccountData = {
+                    "account": data.get("account") or {},
+                    "products": [],  # Filled from the agreements below
+                    "completedDispatches": data.get("completedDispatches") or [],
+                    "devices": data.get("devices") or [],
+                    "plannedDispatches": [],
+                }
 
-                    # Extract product information from the account agreements if available
-                    # This helps maintain compatibility with code expecting the products field
+                # Sort the GraphQL errors in a single pass: missing devices,
+                # chargingSessions errors, and non-critical vs other errors
+                has_missing_devices_error = False
+                has_charging_sessions_error = False
+                non_critical_errors = []
+                other_errors = []
+                for error in response.get("errors") or ():
+                    error_code = _error_code(error)
+                    error_path = error.get("path") or ()
+                    # Only an error on the devices field itself means the
+                    # account has no devices (not nested errors)
                     if (
-                        result["account"]
-                        and "allProperties" in result["account"]
-                        and result["account"]["allProperties"]
+                        error_code in MISSING_DEVICE_ERROR_CODES
+                        and error_path == ["devices"]
                     ):
-                        try:
-                            # Try to extract products from electricityMalos agreements
-                            products = []
-                            for property_data in result["account"]["allProperties"]:
-                                if "electricityMalos" in property_data:
-                                    for malo in property_data["electricityMalos"]:
-                                        if "agreements" in malo:
-                                            for agreement in malo["agreements"]:
-                                                if "product" in agreement:
-                                                    products.append(
-                                                        agreement["product"]
-                                                    )
-
-                            # Only update if we found products
-                            if products:
-                                result["products"] = products
-                                _LOGGER.debug(
-                                    "Extracted %d products from account data",
-                                    len(products),
-                                )
-                        except Exception as extract_error:
-                            _LOGGER.warning(
-                                "Error extracting products from account data: %s",
-                                extract_error,
-                            )
+                        has_missing_devices_error = True
+                    if (
+                        "chargingSessions" in error_path
+                        and not has_charging_sessions_error
+                    ):
+                        has_charging_sessions_error = True
+                        _LOGGER.debug(
+                            "Error in chargingSessions path [%s], will use cached data",
+                            error_code,
+                        )
+                    if error_code in NON_CRITICAL_ERROR_CODES:
+                        non_critical_errors.append(error)
+                    else:
+                        other_errors.append(error)
 
-                if "devices" in data:
-                    result["devices"] = (
-                        data["devices"] if data["devices"] is not None else []
-                    )
+                if include_devices:
+                    # No devices returned together with a devices error means
+                    # the account has none
+                    if not result["devices"] and has_missing_devices_error:
+                        _LOGGER.debug(
+                            "No devices found for account %s, skipping device lookup for %s hours",
+                            account_number,
+                            DEVICES_REPROBE_INTERVAL // 3600,
+                        )
+                        self._devices_missing[account_number] = time.time()
+                    else:
+                        self._devices_missing.pop(account_number, None)
 
-                    # Check if there are errors specifically for chargingSessions
-                    # If so, set to None to preserve cached sensor values
-                    has_charging_sessions_error = False
-                    if "errors" in response:
-                        for error in response["errors"]:
-                            error_path = error.get("path", [])
-                            # Check if error is in chargingSessions path
-                            if "chargingSessions" in error_path:
-                                has_charging_sessions_error = True
-                                error_code = error.get("extensions", {}).get(
-                                    "errorCode"
-                                )
-                                _LOGGER.debug(
-                                    "Error in chargingSessions path [%s], will use cached data",
-                                    error_code,
-                                )
-                                break
+                # Extract product information from the account agreements if available
+                # This helps maintain compatibility with code expecting the products field
+                if all_properties := result["account"].get("allProperties"):
+                    try:
+                        # Try to extract products from electricityMalos agreements
+                        products = [
+                            agreement["product"]
+                            for property_data in all_properties
+                            for malo in property_data.get("electricityMalos") or ()
+                            for agreement in malo.get("agreements") or ()
+                            if "product" in agreement
+                        ]
+
+                        # Only update if we found products
+                        if products:
+                            result["products"] = products
+                            _LOGGER.debug(
+                                "Extracted %d products from account data",
+                                len(products),
+                            )
+                    except Exception as extract_error:
+                        _LOGGER.warning(
+                            "Error extracting products from account data: %s",
+                            extract_error,
+                        )
 
+                if "devices" in data:
                     # Extract charging sessions from devices (now included in COMPREHENSIVE_QUERY)
+                    # On errors specifically for chargingSessions, set to None to preserve cached sensor values
                     charging_sessions = [] if not has_charging_sessions_error else None
 
                     # Only process if there was no chargingSessions error
@@ -1231,13 +1604,6 @@ class OctopusGermany:
                                             session["soc_final"] = session.get(
                                                 "stateOfChargeFinal"
                                             )
-                                        if (
-                                            "soc_change" not in session
-                                            and "stateOfChargeChange" in session
-                                        ):
-                                            session["soc_change"] = session.get(
-                                                "stateOfChargeChange"
-                                            )
                                         # Add device context to session
                                         session["device_id"] = device_id
                                         session["device_name"] = device_name
@@ -1262,76 +1628,77 @@ class OctopusGermany:
                             len(result["devices"]),
                         )
 
-                if "completedDispatches" in data:
-                    result["completedDispatches"] = (
-                        data["completedDispatches"]
-                        if data["completedDispatches"] is not None
-                        else []
-                    )
-
                 # Fetch flex planned dispatches for all devices with the new API
-                result["plannedDispatches"] = []
                 has_dispatch_fetch_error = False
                 if result["devices"]:
                     _LOGGER.debug(
                         "Fetching flex planned dispatches for %d devices",
                         len(result["devices"]),
                     )
-                    for device in result["devices"]:
-                        device_id = device.get("id")
+                    # Fetch the dispatches of all devices concurrently
+                    devices_with_id = [d for d in result["devices"] if d.get("id")]
+                    all_flex_dispatches = await asyncio.gather(
+                        *(
+                            self.fetch_flex_planned_dispatches(device["id"])
+                            for device in devices_with_id
+                        ),
+                        return_exceptions=True,
+                    )
+                    for device, flex_dispatches in zip(
+                        devices_with_id, all_flex_dispatches
+                    ):
+                        device_id = device["id"]
                         device_name = device.get("name", "Unknown")
-                        if device_id:
-                            try:
-                                flex_dispatches = (
-                                    await self.fetch_flex_planned_dispatches(device_id)
-                                )
-                                # If None returned, it means API error - keep old data
-                                if flex_dispatches is None:
-                                    has_dispatch_fetch_error = True
-                                    _LOGGER.debug(
-                                        "Skipping device %s due to API error (will use cached data)",
-                                        device_id,
-                                    )
-                                    continue
-                                if flex_dispatches:
-                                    # Transform the new API format to match the old format for backward compatibility
-                                    for dispatch in flex_dispatches:
-                                        # Map new fields to old field names where possible
-                                        transformed_dispatch = {
-                                            "start": dispatch.get("start"),
-                                            "startDt": dispatch.get(
-                                                "start"
-                                            ),  # Same as start
-                                            "end": dispatch.get("end"),
-                                            "endDt": dispatch.get("end"),  # Same as end
-                                            "deltaKwh": dispatch.get("energyAddedKwh"),
-                                            "delta": dispatch.get(
-                                                "energyAddedKwh"
-                                            ),  # Same as deltaKwh
-                                            "type": dispatch.get(
-                                                "type", "UNKNOWN"
-                                            ),  # Add type as top-level attribute
-                                            "meta": {
-                                                "source": "flex_api",
-                                                "type": dispatch.get("type", "UNKNOWN"),
-                                                "deviceId": device_id,
-                                            },
-                                        }
-                                        result["plannedDispatches"].append(
-                                            transformed_dispatch
-                                        )
-                                    _LOGGER.debug(
-                                        "Added %d flex planned dispatches from device %s (%s)",
-                                        len(flex_dispatches),
-                                        device_id,
-                                        device_name,
-                                    )
-                            except Exception as e:
-                                _LOGGER.warning(
-                                    "Failed to fetch flex planned dispatches for device %s: %s",
-                                    device_id,
-                                    e,
+                        if isinstance(flex_dispatches, asyncio.CancelledError):
+                            raise flex_dispatches
+                        if isinstance(flex_dispatches, BaseException):
+                            # Treat a failed fetch like an API error - keep old data
+                            has_dispatch_fetch_error = True
+                            _LOGGER.warning(
+                                "Failed to fetch flex planned dispatches for device %s: %s",
+                                device_id,
+                                flex_dispatches,
+                            )
+                            continue
+                        # If None returned, it means API error - keep old data
+                        if flex_dispatches is None:
+                            has_dispatch_fetch_error = True
+                            _LOGGER.debug(
+                                "Skipping device %s due to API error (will use cached data)",
+                                device_id,
+                            )
+                            continue
+                        if flex_dispatches:
+                            # Transform the new API format to match the old format for backward compatibility
+                            for dispatch in flex_dispatches:
+                                # Map new fields to old field names where possible
+                                transformed_dispatch = {
+                                    "start": dispatch.get("start"),
+                                    "startDt": dispatch.get("start"),  # Same as start
+                                    "end": dispatch.get("end"),
+                                    "endDt": dispatch.get("end"),  # Same as end
+                                    "deltaKwh": dispatch.get("energyAddedKwh"),
+                                    "delta": dispatch.get(
+                                        "energyAddedKwh"
+                                    ),  # Same as deltaKwh
+                                    "type": dispatch.get(
+                                        "type", "UNKNOWN"
+                                    ),  # Add type as top-level attribute
+                                    "meta": {
+                                        "source": "flex_api",
+                                        "type": dispatch.get("type", "UNKNOWN"),
+                                        "deviceId": device_id,
+                                    },
+                                }
+                                result["plannedDispatches"].append(
+                                    transformed_dispatch
                                 )
+                            _LOGGER.debug(
+                                "Added %d flex planned dispatches from device %s (%s)",
+                                len(flex_dispatches),
+                                device_id,
+                                device_name,
+                            )
                 else:
                     _LOGGER.debug(
                         "No devices found, skipping flex planned dispatches fetch"
@@ -1344,44 +1711,20 @@ class OctopusGermany:
                     )
                     # Don't update result["plannedDispatches"] - let coordinator keep old data
                     # by removing it from result so coordinator knows to use cached value
-                    if (
-                        "plannedDispatches" in result
-                        and not result["plannedDispatches"]
-                    ):
-                        result.pop("plannedDispatches")
+                    if not result["plannedDispatches"]:
+                        del result["plannedDispatches"]
 
                 # Only log errors but don't fail the whole request if we got at least account data
+                # Non-critical errors are missing resources and temporary API
+                # issues, others might affect the account data
                 if "errors" in response and result["account"]:
-                    # Define non-critical error codes that should not fail the request
-                    # These are temporary API issues or expected missing data scenarios
-                    NON_CRITICAL_ERROR_CODES = [
-                        "KT-CT-4301",  # Resource not found (expected when no data exists)
-                        "KT-CT-4340",  # Unable to fetch flex planned dispatches (temporary)
-                        "KT-CT-4382",  # Unable to fetch charging sessions (temporary)
-                        "KT-CT-7899",  # Internal server error (temporary API issue)
-                        "KT-CT-1111",  # Unauthorized for specific query (permission issue)
-                    ]
-
-                    # Filter non-critical errors (missing resources, temporary API issues)
-                    non_critical_errors = [
-                        error
-                        for error in response["errors"]
-                        if error.get("extensions", {}).get("errorCode")
-                        in NON_CRITICAL_ERROR_CODES
-                    ]
-
-                    # Handle other errors that might affect the account data
-                    other_errors = [
-                        error
-                        for error in response["errors"]
-                        if error not in non_critical_errors
-                    ]
-
                     if non_critical_errors:
                         # Log non-critical errors at DEBUG level with clear context
                         for error in non_critical_errors:
-                            error_code = error.get("extensions", {}).get("errorCode")
-                            error_path = ".".join(str(p) for p in error.get("path", []))
+                            error_code = _error_code(error)
+                            error_path = ".".join(
+                                str(p) for p in error.get("path") or []
+                            )
                             error_msg = error.get("message", "No message")
                             _LOGGER.debug(
                                 "Non-critical API error [%s] at path '%s': %s (using cached data)",
@@ -1391,37 +1734,23 @@ class OctopusGermany:
                             )
 
                     if other_errors:
-                        _LOGGER.error("API returned critical errors: %s", other_errors)
-
-                        # Check for token expiry in the other errors
-                        for error in other_errors:
-                            error_code = error.get("extensions", {}).get("errorCode")
-                            if error_code == "KT-CT-1124":  # JWT expired
-                                _LOGGER.warning("Token expired, refreshing...")
-                                self._token_manager.clear()
-                                success = await self.login()
-                                if success:
-                                    # Retry with new token
-                                    return await self.fetch_all_data(account_number)
+                        _LOGGER.error(
+                            "API returned critical errors: %s",
+                            _summarize_errors(other_errors),
+                        )
 
                 # Fetch electricity smart meter readings if property data is available
                 try:
-                    if (
-                        result.get("account")
-                        and "allProperties" in result["account"]
-                        and result["account"]["allProperties"]
-                    ):
+                    if all_properties:
                         # Try to get property ID from the first property
-                        property_data = result["account"]["allProperties"][0]
+                        property_data = all_properties[0]
                         property_id = property_data.get("id")
 
                         if property_id:
                             # First, explore the property schema to understand available data (only once)
                             from .const import EXPLORE_SCHEMA_ONCE
 
-                            if EXPLORE_SCHEMA_ONCE and not hasattr(
-                                self, "_schema_explored"
-                            ):
+                            if EXPLORE_SCHEMA_ONCE and not self._schema_explored:
                                 _LOGGER.info(
                                     "Exploring property schema for debugging smart meter issues..."
                                 )
@@ -1460,41 +1789,29 @@ class OctopusGermany:
                                 ],
                             )
 
-                            smart_meter_readings = None
-                            successful_date = None
+                            # Query all dates at once and use the first with data
+                            (
+                                smart_meter_date,
+                                smart_meter_readings,
+                            ) = await self.fetch_electricity_smart_meter_readings_multi(
+                                account_number,
+                                property_id,
+                                [date_str for date_str, _ in test_dates],
+                            )
 
-                            # Test each date until we find data
-                            for date_str, date_label in test_dates:
-                                _LOGGER.debug(
-                                    "Fetching electricity smart meter readings for property %s on %s (%s)",
-                                    property_id,
-                                    date_str,
-                                    date_label,
+                            successful_date = None
+                            if smart_meter_readings:
+                                successful_date = (
+                                    smart_meter_date,
+                                    dict(test_dates)[smart_meter_date],
                                 )
-
-                                readings = (
-                                    await self.fetch_electricity_smart_meter_readings(
-                                        account_number, property_id, date_str
-                                    )
+                                _LOGGER.info(
+                                    "Successfully fetched %d smart meter readings for %s (%s)",
+                                    len(smart_meter_readings),
+                                    successful_date[1],
+                                    successful_date[0],
                                 )
 
-                                if readings:
-                                    smart_meter_readings = readings
-                                    successful_date = (date_str, date_label)
-                                    _LOGGER.info(
-                                        "Successfully fetched %d smart meter readings for %s (%s)",
-                                        len(readings),
-                                        date_label,
-                                        date_str,
-                                    )
-                                    break
-                                else:
-                                    _LOGGER.debug(
-                                        "No smart meter readings found for %s (%s)",
-                                        date_label,
-                                        date_str,
-                                    )
-
                             if smart_meter_readings:
                                 result["electricity_smart_meter_readings"] = (
                                     smart_meter_readings
@@ -1537,10 +1854,11 @@ class OctopusGermany:
                                         "No smart meter readings available with any query or date - checking property structure"
                                     )
                                     # Log the entire property structure for debugging
-                                    _LOGGER.info(
-                                        "Property data structure: %s",
-                                        json.dumps(property_data, indent=2),
-                                    )
+                                    if _LOGGER.isEnabledFor(logging.INFO):
+                                        _LOGGER.info(
+                                            "Property data structure: %s",
+                                            json.dumps(property_data, indent=2),
+                                        )
                         else:
                             _LOGGER.debug(
                                 "No property ID found for smart meter readings"
@@ -1559,30 +1877,104 @@ class OctopusGermany:
                 return result
             elif "errors" in response:
                 # Handle critical errors that prevent any data from being returned
-                error = response.get("errors", [{}])[0]
-                error_code = error.get("extensions", {}).get("errorCode")
+                raise OctopusAPIError(
+                    "API returned critical errors with no data: "
+                    + _summarize_errors(response["errors"])
+                )
+            else:
+                raise OctopusAPIError("API response contains neither data nor errors")
 
-                # Check if token expired error
-                if error_code == "KT-CT-1124":  # JWT expired
-                    _LOGGER.warning("Token expired, refreshing...")
-                    self._token_manager.clear()
-                    success = await self.login()
-                    if success:
-                        # Retry with new token
-                        return await self.fetch_all_data(account_number)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise OctopusAPIError(f"Error fetching all data: {e}") from e
 
-                _LOGGER.error(
-                    "API returned critical errors with no data: %s",
-                    response.get("errors"),
-                )
-                return None
+    async def fetch_all_accounts(self, account_numbers: list[str]):
+        """Fetch all data for several accounts concurrently.
+
+        Returns a list with one entry per account number, holding either the
+        fetch_all_data() result or the exception it raised.
+        """
+        # Refresh expired property data for all accounts in one request up front
+        # and hand each account its result, stale or missing, so a failed or
+        # partial batch doesn't cause a property request per account
+        properties = await self.fetch_static_data_batch(account_numbers)
+        return await asyncio.gather(
+            *(
+                self.fetch_all_data(number, properties[number])
+                for number in account_numbers
+            ),
+            return_exceptions=True,
+        )
+
+    async def fetch_static_data(self, account_number: str):
+        """Fetch the property, tariff and meter data for an account.
+
+        This data changes rarely, so it is cached for STATIC_DATA_CACHE_TTL
+        seconds instead of being requested on every poll. A stale cached
+        value is returned if the refresh fails.
+        """
+        result = await self.fetch_static_data_batch([account_number])
+        return result[account_number]
+
+    async def fetch_static_data_batch(self, account_numbers: list[str]):
+        """Fetch the property data for several accounts in a single request.
+
+        Only accounts whose cached data has expired are requested.
+
+        Returns:
+            Dict mapping each account number to its allProperties list, or None
+            if no data is available for it
+        """
+        now = time.time()
+        result = {}
+        expired = []
+        for number in account_numbers:
+            cached = self._static_cache.get(number)
+            if cached and now - cached[0] < STATIC_DATA_CACHE_TTL:
+                result[number] = cached[1]
             else:
-                _LOGGER.error("API response contains neither data nor errors")
-                return None
+                expired.append(number)
+        if not expired:
+            return result
 
-        except Exception as e:
-            _LOGGER.error("Error fetching all data: %s", e)
-            return None
+        try:
+            response = await self._execute_graphql(
+                query=_build_static_data_query(len(expired)),
+                variables={f"a{i}": number for i, number in enumerate(expired)},
+            )
+        except (OctopusAPIError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.warning("Error fetching property data: %s", e)
+            response = None
+
+        data = (response or {}).get("data") or {}
+        errors = (response or {}).get("errors") or []
+        for i, number in enumerate(expired):
+            alias = f"a{i}"
+            cached = self._static_cache.get(number)
+            properties = (data.get(alias) or {}).get("allProperties")
+            if properties is None:
+                if response is not None:
+                    _LOGGER.warning(
+                        "No property data returned for account %s: %s",
+                        number,
+                        _summarize_errors(errors),
+                    )
+                result[number] = cached[1] if cached else None
+                continue
+
+            # Only cache complete responses so partial data is retried on the next poll
+            account_errors = [
+                e for e in errors if (e.get("path") or [None])[0] == alias
+            ]
+            if account_errors:
+                _LOGGER.debug(
+                    "Property data for account %s returned with errors: %s",
+                    number,
+                    account_errors,
+                )
+            else:
+                self._static_cache[number] = (time.time(), properties)
+            result[number] = properties
+        return result
 
     async def fetch_charging_sessions(self, account_number: str):
         """Fetch charging sessions for smart charging rewards tracking.
@@ -1598,11 +1990,10 @@ class OctopusGermany:
             )
             return None
 
-        client = self._get_graphql_client()
         variables = {"accountNumber": account_number}
 
         try:
-            response = await client.execute_async(
+            response = await self._execute_graphql(
                 query=CHARGING_SESSIONS_QUERY, variables=variables
             )
 
@@ -1644,22 +2035,10 @@ class OctopusGermany:
 
                 return all_sessions
             elif "errors" in response:
-                error = response.get("errors", [{}])[0]
-                error_code = error.get("extensions", {}).get("errorCode")
-
-                # Check if token expired error
-                if error_code == "KT-CT-1124":  # JWT expired
-                    _LOGGER.warning("Token expired, refreshing...")
-                    self._token_manager.clear()
-                    success = await self.login()
-                    if success:
-                        # Retry with new token
-                        return await self.fetch_charging_sessions(account_number)
-
                 _LOGGER.info(
                     "No charging sessions available for account %s (may not have SmartFlex devices): %s",
                     account_number,
-                    response.get("errors"),
+                    _summarize_errors(response.get("errors")),
                 )
                 return []  # Empty list is valid - means no devices/sessions
             else:
@@ -1680,42 +2059,25 @@ class OctopusGermany:
             _LOGGER.error("Failed to ensure valid token for change_device_suspension")
             return None
 
-        query = """
-            mutation ChangeDeviceSuspension($deviceId: ID = "", $action: SmartControlAction!) {
-              updateDeviceSmartControl(input: {deviceId: $deviceId, action: $action}) {
-                id
-              }
-            }
-        """
         variables = {"deviceId": device_id, "action": action}
         _LOGGER.debug(
             "Executing change_device_suspension: device_id=%s, action=%s",
             device_id,
             action,
         )
-        client = self._get_graphql_client()
         try:
-            response = await client.execute_async(query=query, variables=variables)
+            response = await self._execute_graphql(
+                query=CHANGE_DEVICE_SUSPENSION_MUTATION, variables=variables
+            )
             _LOGGER.debug("Change device suspension response: %s", response)
 
             if "errors" in response:
-                error = response.get("errors", [{}])[0]
-                error_code = error.get("extensions", {}).get("errorCode")
-
-                # Check if token expired error
-                if error_code == "KT-CT-1124":  # JWT expired
-                    _LOGGER.warning(
-                        "Token expired during device suspension change, refreshing..."
-                    )
-                    self._token_manager.clear()
-                    success = await self.login()
-                    if success:
-                        # Retry with new token
-                        return await self.change_device_suspension(device_id, action)
-
-                _LOGGER.error("API returned errors: %s", response["errors"])
+                _LOGGER.error(
+                    "API returned errors: %s", _summarize_errors(response["errors"])
+                )
                 return None
 
+            self.invalidate_response_cache()
             return (
                 response.get("data", {}).get("updateDeviceSmartControl", {}).get("id")
             )
@@ -1779,34 +2141,18 @@ class OctopusGermany:
             _LOGGER.error("Time format validation error: %s", e)
             return False
 
-        # Use the new setDevicePreferences mutation - based on the exact working example
-        # No variables, everything inline as shown in the working example
-        query = f"""
-        mutation setDevicePreferences {{
-          setDevicePreferences(
-            input: {{
-              deviceId: "{device_id}",
-              mode: CHARGE,
-              unit: PERCENTAGE,
-              schedules: [
-                {{ dayOfWeek: MONDAY, time: "{formatted_time}", max: {target_percentage} }},
-                {{ dayOfWeek: TUESDAY, time: "{formatted_time}", max: {target_percentage} }},
-                {{ dayOfWeek: WEDNESDAY, time: "{formatted_time}", max: {target_percentage} }},
-                {{ dayOfWeek: THURSDAY, time: "{formatted_time}", max: {target_percentage} }},
-                {{ dayOfWeek: FRIDAY, time: "{formatted_time}", max: {target_percentage} }},
-                {{ dayOfWeek: SATURDAY, time: "{formatted_time}", max: {target_percentage} }},
-                {{ dayOfWeek: SUNDAY, time: "{formatted_time}", max: {target_percentage} }}
-              ]
-            }}
-          ) {{
-            id
-          }}
-        }}
-        """
-
-        variables = {}
-
-        client = self._get_graphql_client()
+        # Same charge target and time for every day of the week
+        variables = {
+            "input": {
+                "deviceId": device_id,
+                "mode": "CHARGE",
+                "unit": "PERCENTAGE",
+                "schedules": [
+                    {"dayOfWeek": day, "time": formatted_time, "max": target_percentage}
+                    for day in WEEKDAYS
+                ],
+            }
+        }
 
         _LOGGER.debug(
             "Making set_device_preferences API request with device_id: %s, target: %s%%, time: %s",
@@ -1816,12 +2162,14 @@ class OctopusGermany:
         )
 
         try:
-            response = await client.execute_async(query=query, variables=variables)
+            response = await self._execute_graphql(
+                query=SET_DEVICE_PREFERENCES_MUTATION, variables=variables
+            )
             _LOGGER.debug("Set device preferences response: %s", response)
 
             if "errors" in response:
                 error = response.get("errors", [{}])[0]
-                error_code = error.get("extensions", {}).get("errorCode")
+                error_code = _error_code(error)
                 error_message = error.get("message", "Unknown error")
 
                 _LOGGER.error(
@@ -1830,23 +2178,9 @@ class OctopusGermany:
                     error_code,
                 )
 
-                # Check if token expired error
-                if error_code == "KT-CT-1124":  # JWT expired
-                    _LOGGER.warning(
-                        "Token expired during setting device preferences, refreshing..."
-                    )
-                    self._token_manager.clear()
-                    success = await self.login()
-                    if success:
-                        # Retry with new token
-                        return await self.set_device_preferences(
-                            device_id,
-                            target_percentage,
-                            target_time,
-                        )
-
                 return False
 
+            self.invalidate_response_cache()
             return True
         except Exception as e:
             _LOGGER.error("Error setting device preferences: %s", e)
@@ -1866,14 +2200,12 @@ class OctopusGermany:
             return None
 
         variables = {"accountNumber": account_number}
-        client = self._get_graphql_client()
-
         try:
             _LOGGER.debug(
                 "Fetching vehicle devices for account %s",
                 account_number,
             )
-            response = await client.execute_async(
+            response = await self._execute_graphql(
                 query=VEHICLE_DETAILS_QUERY, variables=variables
             )
 
@@ -1882,21 +2214,9 @@ class OctopusGermany:
                 return None
 
             if "errors" in response:
-                error = response.get("errors", [{}])[0]
-                error_code = error.get("extensions", {}).get("errorCode")
-
-                # Check if token expired error
-                if error_code == "KT-CT-1124":  # JWT expired
-                    _LOGGER.warning("Token expired, refreshing...")
-                    self._token_manager.clear()
-                    success = await self.login()
-                    if success:
-                        # Retry with new token
-                        return await self.get_vehicle_devices(account_number)
-
                 _LOGGER.error(
                     "GraphQL errors in vehicle devices response: %s",
-                    response["errors"],
+                    _summarize_errors(response["errors"]),
                 )
                 return None
 
@@ -1938,26 +2258,14 @@ class OctopusGermany:
             )
             return None
 
-        # Use inline query with device ID as shown in the working example
-        query = f"""
-        query flexPlannedDispatches {{
-          flexPlannedDispatches(deviceId: "{device_id}") {{
-            end
-            energyAddedKwh
-            start
-            type
-          }}
-        }}
-        """
-
-        client = self._get_graphql_client()
-
         try:
             _LOGGER.debug(
                 "Fetching flex planned dispatches for device %s",
                 device_id,
             )
-            response = await client.execute_async(query=query, variables={})
+            response = await self._execute_graphql(
+                query=FLEX_PLANNED_DISPATCHES_QUERY, variables={"deviceId": device_id}
+            )
 
             if response is None:
                 _LOGGER.error("API returned None response for flex planned dispatches")
@@ -1965,20 +2273,11 @@ class OctopusGermany:
 
             if "errors" in response:
                 error = response.get("errors", [{}])[0]
-                error_code = error.get("extensions", {}).get("errorCode")
+                error_code = _error_code(error)
                 error_message = error.get("message", "Unknown error")
 
-                # Check if token expired error
-                if error_code == "KT-CT-1124":  # JWT expired
-                    _LOGGER.warning("Token expired, refreshing...")
-                    self._token_manager.clear()
-                    success = await self.login()
-                    if success:
-                        # Retry with new token
-                        return await self.fetch_flex_planned_dispatches(device_id)
-
                 # Log but don't fail for non-critical errors (device might not support flex dispatches)
-                if error_code == "KT-CT-4301":  # Resource not found
+                if error_code in MISSING_DEVICE_ERROR_CODES:
                     _LOGGER.debug(
                         "Device %s does not support flex planned dispatches: %s",
                         device_id,
@@ -1997,7 +2296,7 @@ class OctopusGermany:
                 else:
                     _LOGGER.error(
                         "GraphQL errors in flex planned dispatches response: %s",
-                        response["errors"],
+                        _summarize_errors(response["errors"]),
                     )
                     return None
 
@@ -2116,149 +2415,89 @@ class OctopusGermany:
             "devices": all_data["devices"],
         }
 
-    async def fetch_gas_meter_reading(self, account_number: str, meter_id: str):
-        """Fetch the latest gas meter reading for a specific meter.
+    async def fetch_latest_meter_readings(
+        self,
+        account_number: str,
+        electricity_meter_id: Optional[str] = None,
+        gas_meter_id: Optional[str] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Fetch the latest electricity and gas meter readings in one request.
 
         Args:
             account_number: The account number
-            meter_id: The gas meter ID
+            electricity_meter_id: The electricity meter ID, if any
+            gas_meter_id: The gas meter ID, if any
 
         Returns:
-            Dict containing the latest reading data or None if error
+            Tuple of the latest electricity and gas reading, each None if the
+            meter is not given or its reading could not be fetched
         """
-        if not await self.ensure_token():
-            _LOGGER.error("Failed to ensure valid token for fetch_gas_meter_reading")
-            return None
-
-        variables = {"accountNumber": account_number, "meterId": meter_id}
-        client = self._get_graphql_client()
-
-        try:
-            _LOGGER.debug(
-                "Fetching gas meter reading for account %s, meter %s",
-                account_number,
-                meter_id,
-            )
-            response = await client.execute_async(
-                query=GAS_METER_READINGS_QUERY, variables=variables
-            )
-
-            if response is None:
-                _LOGGER.error("API returned None response for gas meter reading")
-                return None
-
-            if "errors" in response:
-                _LOGGER.error(
-                    "GraphQL errors in gas meter reading response: %s",
-                    response["errors"],
-                )
-                return None
-
-            if "data" in response and "gasMeterReadings" in response["data"]:
-                readings_data = response["data"]["gasMeterReadings"]
-
-                if (
-                    readings_data
-                    and "edges" in readings_data
-                    and readings_data["edges"]
-                ):
-                    # Get the first (latest) reading
-                    latest_reading = readings_data["edges"][0]["node"]
-                    _LOGGER.debug(
-                        "Got gas meter reading: %s at %s (type: %s, origin: %s)",
-                        latest_reading.get("value"),
-                        latest_reading.get("readAt"),
-                        latest_reading.get("typeOfRead"),
-                        latest_reading.get("origin"),
-                    )
-                    return latest_reading
-                else:
-                    _LOGGER.warning(
-                        "No gas meter readings found for meter %s", meter_id
-                    )
-                    return None
-            else:
-                _LOGGER.error("Invalid response structure for gas meter reading")
-                return None
-
-        except Exception as e:
-            _LOGGER.error("Error fetching gas meter reading: %s", e)
-            return None
-
-    async def fetch_electricity_meter_reading(self, account_number: str, meter_id: str):
-        """Fetch the latest electricity meter reading for a specific meter.
-
-        Args:
-            account_number: The account number
-            meter_id: The electricity meter ID
+        if not electricity_meter_id and not gas_meter_id:
+            return None, None
 
-        Returns:
-            Dict containing the latest reading data or None if error
-        """
         if not await self.ensure_token():
             _LOGGER.error(
-                "Failed to ensure valid token for fetch_electricity_meter_reading"
+                "Failed to ensure valid token for fetch_latest_meter_readings"
             )
-            return None
+            return None, None
 
-        variables = {"accountNumber": account_number, "meterId": meter_id}
-        client = self._get_graphql_client()
+        variables = {"accountNumber": account_number}
+        meters = {}
+        if electricity_meter_id:
+            variables["electricityMeterId"] = electricity_meter_id
+            meters["electricityMeterReadings"] = electricity_meter_id
+        if gas_meter_id:
+            variables["gasMeterId"] = gas_meter_id
+            meters["gasMeterReadings"] = gas_meter_id
 
         try:
             _LOGGER.debug(
-                "Fetching electricity meter reading for account %s, meter %s",
+                "Fetching latest meter readings for account %s, meters %s",
                 account_number,
-                meter_id,
+                list(meters.values()),
             )
-            response = await client.execute_async(
-                query=ELECTRICITY_METER_READINGS_QUERY, variables=variables
+            response = await self._execute_graphql(
+                query=_build_latest_readings_query(
+                    bool(electricity_meter_id), bool(gas_meter_id)
+                ),
+                variables=variables,
             )
+        except Exception as e:
+            _LOGGER.error("Error fetching latest meter readings: %s", e)
+            return None, None
 
-            if response is None:
-                _LOGGER.error(
-                    "API returned None response for electricity meter reading"
-                )
-                return None
-
-            if "errors" in response:
-                _LOGGER.error(
-                    "GraphQL errors in electricity meter reading response: %s",
-                    response["errors"],
-                )
-                return None
-
-            if "data" in response and "electricityMeterReadings" in response["data"]:
-                readings_data = response["data"]["electricityMeterReadings"]
+        if response is None:
+            _LOGGER.error("API returned None response for latest meter readings")
+            return None, None
 
-                if (
-                    readings_data
-                    and "edges" in readings_data
-                    and readings_data["edges"]
-                ):
-                    # Get the first (latest) reading
-                    latest_reading = readings_data["edges"][0]["node"]
-                    _LOGGER.debug(
-                        "Got electricity meter reading: %s at %s (type: %s, origin: %s)",
-                        latest_reading.get("value"),
-                        latest_reading.get("readAt"),
-                        latest_reading.get("typeOfRead"),
-                        latest_reading.get("origin"),
-                    )
-                    return latest_reading
-                else:
-                    _LOGGER.warning(
-                        "No electricity meter readings found for meter %s", meter_id
-                    )
-                    return None
+        # Errors only invalidate the reading they point at; errors without a
+        # path invalidate both
+        failed_fields = set()
+        if errors := response.get("errors"):
+            _LOGGER.error(
+                "GraphQL errors in meter reading response: %s",
+                _summarize_errors(errors),
+            )
+            failed_fields = {(error.get("path") or [None])[0] for error in errors}
+            if None in failed_fields:
+                return None, None
+
+        data = response.get("data") or {}
+        readings = {}
+        for field, meter_id in meters.items():
+            if field in failed_fields:
+                continue
+            edges = (data.get(field) or {}).get("edges")
+            if edges:
+                # The first (latest) reading
+                readings[field] = edges[0]["node"]
             else:
-                _LOGGER.error(
-                    "Invalid response structure for electricity meter reading"
-                )
-                return None
+                _LOGGER.warning("No meter readings found for meter %s", meter_id)
 
-        except Exception as e:
-            _LOGGER.error("Error fetching electricity meter reading: %s", e)
-            return None
+        return (
+            readings.get("electricityMeterReadings"),
+            readings.get("gasMeterReadings"),
+        )
 
     async def fetch_electricity_smart_meter_readings(
         self, account_number: str, property_id: str, date: str
@@ -2285,8 +2524,6 @@ class OctopusGermany:
             "date": date,
         }
 
-        client = self._get_graphql_client()
-
         try:
             _LOGGER.debug(
                 "Fetching smart meter readings for account %s, property %s, date %s",
@@ -2294,7 +2531,7 @@ class OctopusGermany:
                 property_id,
                 date,
             )
-            response = await client.execute_async(
+            response = await self._execute_graphql(
                 query=ELECTRICITY_SMART_METER_READINGS_QUERY, variables=variables
             )
 
@@ -2307,7 +2544,7 @@ class OctopusGermany:
             if "errors" in response:
                 _LOGGER.error(
                     "GraphQL errors in electricity smart meter readings response: %s",
-                    response["errors"],
+                    _summarize_errors(response["errors"]),
                 )
                 return None
 
@@ -2322,18 +2559,7 @@ class OctopusGermany:
                 measurements = response["data"]["account"]["property"]["measurements"]
 
                 if measurements and "edges" in measurements and measurements["edges"]:
-                    readings = []
-                    for edge in measurements["edges"]:
-                        if "node" in edge and edge["node"]:
-                            reading = edge["node"]
-                            readings.append(
-                                {
-                                    "start_time": reading.get("startAt"),
-                                    "end_time": reading.get("endAt"),
-                                    "value": reading.get("value"),
-                                    "unit": reading.get("unit"),
-                                }
-                            )
+                    readings = _hourly_readings(measurements["edges"])
 
                     _LOGGER.debug(
                         "Found %d smart meter readings for property %s on %s",
@@ -2360,6 +2586,83 @@ class OctopusGermany:
             _LOGGER.error("Error fetching electricity smart meter readings: %s", e)
             return None
 
+    async def fetch_electricity_smart_meter_readings_multi(
+        self, account_number: str, property_id: str, dates: List[str]
+    ) -> Tuple[Optional[str], Optional[List[Dict[str, Any]]]]:
+        """Fetch hourly smart meter readings for several dates in one request.
+
+        Args:
+            account_number: The account number
+            property_id: The property ID
+            dates: Dates in YYYY-MM-DD format, in order of preference
+
+        Returns:
+            Tuple of the first date with readings and its readings,
+            (None, []) if no date has readings or (None, None) if error
+        """
+        if not await self.ensure_token():
+            _LOGGER.error(
+                "Failed to ensure valid token for fetch_electricity_smart_meter_readings_multi"
+            )
+            return None, None
+
+        variables = {"accountNumber": account_number, "propertyId": property_id}
+        for i, date in enumerate(dates):
+            variables[f"d{i}"] = date
+
+        try:
+            _LOGGER.debug(
+                "Fetching smart meter readings for account %s, property %s, dates %s",
+                account_number,
+                property_id,
+                dates,
+            )
+            response = await self._execute_graphql(
+                query=_build_smart_meter_readings_query(len(dates)),
+                variables=variables,
+            )
+        except Exception as e:
+            _LOGGER.error("Error fetching electricity smart meter readings: %s", e)
+            return None, None
+
+        if response is None:
+            _LOGGER.error(
+                "API returned None response for electricity smart meter readings"
+            )
+            return None, None
+
+        # Errors only rule out the date whose alias they point at; errors
+        # without such a path rule out all dates
+        failed_aliases = set()
+        if errors := response.get("errors"):
+            _LOGGER.error(
+                "GraphQL errors in electricity smart meter readings response: %s",
+                _summarize_errors(errors),
+            )
+            for error in errors:
+                path = error.get("path") or []
+                failed_aliases.add(path[2] if len(path) > 2 else None)
+            if None in failed_aliases:
+                return None, None
+
+        data = response.get("data") or {}
+        property_data = (data.get("account") or {}).get("property") or {}
+        for i, date in enumerate(dates):
+            alias = f"d{i}"
+            if alias in failed_aliases:
+                continue
+            edges = (property_data.get(alias) or {}).get("edges")
+            if readings := _hourly_readings(edges or []):
+                return date, readings
+            _LOGGER.debug(
+                "No smart meter readings for property %s on %s "
+                "(data may not be available yet)",
+                property_id,
+                date,
+            )
+
+        return None, []
+
     async def fetch_electricity_15min_readings(
         self, account_number: str, property_id: str, date: str
     ):
@@ -2383,10 +2686,8 @@ class OctopusGermany:
             "date": date,
         }
 
-        client = self._get_graphql_client()
-
         try:
-            response = await client.execute_async(
+            response = await self._execute_graphql(
                 query=ELECTRICITY_15MIN_READINGS_QUERY, variables=variables
             )
 
@@ -2395,7 +2696,8 @@ class OctopusGermany:
 
             if "errors" in response:
                 _LOGGER.error(
-                    "GraphQL errors in 15min readings: %s", response["errors"]
+                    "GraphQL errors in 15min readings: %s",
+                    _summarize_errors(response["errors"]),
                 )
                 return None
 
@@ -2456,8 +2758,6 @@ class OctopusGermany:
             "date": date,
         }
 
-        client = self._get_graphql_client()
-
         try:
             _LOGGER.debug(
                 "Fetching smart meter readings V2 for account %s, property %s, date %s",
@@ -2465,7 +2765,7 @@ class OctopusGermany:
                 property_id,
                 date,
             )
-            response = await client.execute_async(
+            response = await self._execute_graphql(
                 query=ELECTRICITY_SMART_METER_READINGS_QUERY_V2, variables=variables
             )
 
@@ -2656,15 +2956,13 @@ class OctopusGermany:
             "propertyId": property_id,
         }
 
-        client = self._get_graphql_client()
-
         try:
             _LOGGER.info(
                 "Exploring property schema for account %s, property %s",
                 account_number,
                 property_id,
             )
-            response = await client.execute_async(
+            response = await self._execute_graphql(
                 query=PROPERTY_SCHEMA_QUERY, variables=variables
             )
 
@@ -2685,11 +2983,9 @@ class OctopusGermany:
             _LOGGER.error("Failed to ensure valid token for schema exploration")
             return None
 
-        client = self._get_graphql_client()
-
         try:
             _LOGGER.info("Exploring GraphQL schema...")
-            response = await client.execute_async(query=INTROSPECTION_QUERY)
+            response = await self._execute_graphql(query=INTROSPECTION_QUERY)
 
             # Filter for measurement-related types
             if "data" in response and "__schema" in response["data"]:
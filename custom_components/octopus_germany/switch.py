@@ -19,6 +19,15 @@ from .sensor import get_account_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+# Mutation to trigger or cancel boost charging of a device
+UPDATE_BOOST_CHARGE_MUTATION = """
+mutation updateBoostCharge($input: UpdateBoostChargeInput!) {
+  updateBoostCharge(input: $input) {
+    id
+  }
+}
+"""
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -559,21 +568,13 @@ class BoostChargeSwitch(CoordinatorEntity, SwitchEntity):
 
     async def _async_trigger_boost_charge(self) -> None:
         """Trigger boost charging using updateBoostCharge mutation."""
-        mutation = """
-        mutation triggerBoostCharge($input: UpdateBoostChargeInput!) {
-            updateBoostCharge(input: $input) {
-                id
-            }
-        }
-        """
-
         variables = {"input": {"deviceId": self.device_id, "action": "BOOST"}}
 
         try:
-            # Use the OctopusGermany API client's method
-            client = self.client._get_graphql_client()
-
-            response = await client.execute_async(query=mutation, variables=variables)
+            # Use the OctopusGermany API client's shared session
+            response = await self.client._execute_graphql(
+                query=UPDATE_BOOST_CHARGE_MUTATION, variables=variables
+            )
 
             if "errors" in response:
                 error_messages = [
@@ -594,6 +595,7 @@ class BoostChargeSwitch(CoordinatorEntity, SwitchEntity):
             )
 
             # Request coordinator refresh to update state
+            self.client.invalidate_response_cache()
             await self.coordinator.async_request_refresh()
 
         except Exception as err:
@@ -604,21 +606,13 @@ class BoostChargeSwitch(CoordinatorEntity, SwitchEntity):
 
     async def _async_cancel_boost_charge(self) -> None:
         """Cancel boost charging using updateBoostCharge mutation."""
-        mutation = """
-        mutation cancelBoostCharge($input: UpdateBoostChargeInput!) {
-            updateBoostCharge(input: $input) {
-                id
-            }
-        }
-        """
-
         variables = {"input": {"deviceId": self.device_id, "action": "CANCEL"}}
 
         try:
-            # Use the OctopusGermany API client's method
-            client = self.client._get_graphql_client()
-
-            response = await client.execute_async(query=mutation, variables=variables)
+            # Use the OctopusGermany API client's shared session
+            response = await self.client._execute_graphql(
+                query=UPDATE_BOOST_CHARGE_MUTATION, variables=variables
+            )
 
             if "errors" in response:
                 error_messages = [
@@ -639,6 +633,7 @@ class BoostChargeSwitch(CoordinatorEntity, SwitchEntity):
             )
 
             # Request coordinator refresh to update state
+            self.client.invalidate_response_cache()
             await self.coordinator.async_request_refresh()
 
         except Exception as err: